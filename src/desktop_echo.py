@@ -3,16 +3,24 @@ from tracemalloc import start
 import customtkinter as ctk
 import threading
 import queue
+import concurrent.futures
+import collections
+import functools
+import array
+import itertools
+import logging
+import logging.handlers
 import time
+import re
 import tkinter as tk
-import uuid
 from tkinter import filedialog, messagebox
 import sys
 import os
 import importlib
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from echo_core import FastDownloader
+from echo_core import FastDownloader, DownloadCancelled, BYTES_TO_MB
 from datetime import datetime
+from urllib.parse import urlparse
 from download_history import DownloadHistory
 import json
 # System tray support
@@ -24,6 +32,12 @@ except ImportError:
     SYSTEM_TRAY_AVAILABLE = False
     print("System tray not available. Install pystray and Pillow for tray support.")
 
+# Faster settings parsing when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # browser extension support
 import http.server
 import socketserver
@@ -41,48 +55,231 @@ DEFAULT_CATEGORIES = {
     "Others": []  # catch‑all
 }
 
+# Accepted download URLs
+_URL_RE = re.compile(r'^https?://\S+$')
+
+# Pasted batches larger than this are parsed off the UI thread
+BATCH_PARSE_THRESHOLD = 200
+
+# Most UI events handled per Tk callback before yielding back to the main loop
+UI_EVENT_BATCH = 200
+
+# History rows kept alive in the Recent Downloads tab
+HISTORY_VISIBLE_ROWS = 10
+
+# Status colors in the download queue
+STATUS_COLORS = {
+    "Queued": "gray",
+    "Downloading": "#3B8ED0",
+    "Paused": "orange",
+    "Completed": "green",
+    "Error": "red",
+    "Cancelled": "darkgray"
+}
+
+# Status colors in the history list
+HISTORY_STATUS_COLORS = {
+    "Completed": "green",
+    "Error": "red",
+    "Started": "blue",
+    "Cancelled": "gray"
+}
+
+# UI scaling choices shown in preferences and the factor each one applies
+UI_SCALE_MAP = {"80%": 0.8, "90%": 0.9, "100%": 1.0, "110%": 1.1, "120%": 1.2}
+UI_SCALE_VALUES = list(UI_SCALE_MAP)
+
+# "Default Threads" choices
+THREAD_VALUES = ["1", "2", "4", "8", "12", "16"]
+
+# Delay before a coalesced queue refresh; caps queue redraws at ~10 per second
+QUEUE_REFRESH_MS = 100
+
+# Queue rows created per refresh pass; the rest follow in later passes
+QUEUE_ROWS_PER_PASS = 50
+
+# Worker threads kept alive for running queue items; also the upper bound
+# for the "max concurrent downloads" setting
+DOWNLOAD_WORKERS = 5
+
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Diagnostics go through a queue so the UI thread never waits on console I/O
+_log = logging.getLogger("echo_fetch")
+
+# Log records held for the listener; past this the oldest are dropped
+LOG_QUEUE_SIZE = 1000
+
+class _RingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler over a bounded queue that drops the oldest record instead of blocking"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+
+def _start_logging(level=logging.INFO):
+    """Send echo_fetch log records to stderr from a background listener thread"""
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    _log.addHandler(_RingQueueHandler(log_queue))
+    _log.setLevel(level)
+    _log.propagate = False
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
 def log(msg):
     with open("startup_log.txt", "a") as f:
         f.write(f"{time.time():.3f} - {msg}\n")
 
+@functools.lru_cache(maxsize=4096)
+def _format_history_timestamp(timestamp):
+    """Format an ISO history timestamp for display; cached since rows are re-filled on scroll"""
+    return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+@functools.lru_cache(maxsize=4096)
+def _format_clock(moment):
+    """HH:MM:SS for a queue timestamp; cached since rows re-read the same times on every update"""
+    return moment.strftime('%H:%M:%S')
+
+@functools.lru_cache(maxsize=1024)
+def _format_overall(tenths):
+    """Overall percent label text for a percent given in tenths"""
+    return "Overall: %.1f%%" % (tenths / 10)
+
+@functools.lru_cache(maxsize=4096)
+def _format_speed(hundredths):
+    """Overall speed label text for a speed given in hundredths of MB/s"""
+    return "Speed: %.2f MB/s" % (hundredths / 100)
+
+def _filename_from_url(url):
+    """Last path segment of the URL, ignoring any query string or fragment"""
+    return os.path.basename(urlparse(url).path) or "downloaded_file"
+
 class DownloadItem:
-    def __init__(self, url, download_path, filename=None):
+    # Fixed attribute layout; a queue can hold thousands of these
+    __slots__ = ('url', 'download_path', 'filename', 'status', 'progress', 'speed',
+                 'downloader', 'added_time', 'start_time', 'end_time', 'file_size',
+                 'error_message', 'item_id', 'selected', 'selection_checkbox', 'ui_frame')
+
+    _ids = itertools.count(1)  # source of short, unique item ids
+
+    def __init__(self, url, download_path, filename=None, added_time=None):
         self.url = url
         self.download_path = download_path
-        self.filename = filename
+        self.filename = filename or _filename_from_url(url)
         self.status = "Queued"  # Queued, Downloading, Paused, Completed, Error, Cancelled
         self.progress = 0
         self.speed = 0
         self.downloader = None
-        self.added_time = datetime.now()
+        self.added_time = added_time or datetime.now()
         self.start_time = None
         self.end_time = None
         self.file_size = 0
         self.error_message = ""  # Added for better error tracking
-        self.item_id = str(uuid.uuid4())[:8]  # Unique ID for the item
+        self.item_id = f"{next(DownloadItem._ids):08x}"  # Unique ID for the item
         self.selected = False  # For selection in the queue
+        self.selection_checkbox = None  # Set when the queue row is built
+        self.ui_frame = None
 
     def toggle_selection(self):
         """Toggle the selection state of the download item"""
         self.selected = not self.selected
         return self.selected
 
+class AggregatingProgress:
+    """Latest-wins per-thread progress slots shared between downloader threads and the UI"""
+
+    __slots__ = ('item', 'speeds', 'percents', 'on_change', 'last_emit')
+
+    UPDATE_INTERVAL = 0.2  # seconds between UI wake-ups per item
+
+    def __init__(self, item, on_change=None):
+        self.item = item
+        self.speeds = array.array('d')
+        self.percents = array.array('d')
+        self.on_change = on_change
+        self.last_emit = 0.0
+
+    def resize(self, num_threads):
+        """Allocate per-thread slots once the downloader has picked its thread count"""
+        # Typed arrays store unboxed C doubles, so updates don't build a tuple per event
+        self.speeds = array.array('d', [0.0]) * num_threads
+        self.percents = array.array('d', [0.0]) * num_threads
+
+    def update(self, idx, speed, percent):
+        """Progress callback for FastDownloader - runs on the download threads"""
+        # Element stores are atomic under the GIL, so producers never take a lock
+        self.speeds[idx] = speed
+        self.percents[idx] = percent
+
+        now = time.monotonic()
+        # A thread reaching 100% always gets through so the final state is drawn
+        if self.on_change and (percent >= 100 or now - self.last_emit >= self.UPDATE_INTERVAL):
+            self.last_emit = now
+            self.on_change()
+
 class DownloadManagerUI(ctk.CTk):
+    # Parsed settings.json, loaded on first access
+    _settings = None
+    _settings_dirty = False
+    # (history version, stats, recent records) from the last history window load
+    _history_snapshot = None
+    # Shared right-click menu and the widget it currently acts on
+    _edit_menu = None
+    _menu_target = None
+    # Pending after() ids for the coalesced redraws, cancelled on close
+    _thread_ui_handle = None
+    _queue_refresh_handle = None
+    _closing = False
+    # Upper bound on progress redraws per second across all downloads
+    max_redraw_hz = 5
+    _last_display_ts = 0.0
+    # Text last written to the overall progress/speed labels
+    _last_overall_text = _last_speed_text = None
+    _flush_handle = None  # pending after() id for the debounced settings write
+
+    # Thread progress bars for every fill level of a 15-cell bar
+    _BARS = tuple("█" * i + "░" * (15 - i) for i in range(16))
+
+    # Shared fonts, created once the Tk root exists
+    FONT_9 = FONT_10 = FONT_11 = FONT_11B = FONT_12 = FONT_12B = FONT_14 = FONT_16B = FONT_18B = None
+
     def __init__(self):
         log("Starting application initialization")
         total_start = time.time()
         super().__init__()
         log("Super init completed")
+
+        self.FONT_9 = ctk.CTkFont(size=9)
+        self.FONT_10 = ctk.CTkFont(size=10)
+        self.FONT_11 = ctk.CTkFont(size=11)
+        self.FONT_11B = ctk.CTkFont(size=11, weight="bold")
+        self.FONT_12 = ctk.CTkFont(size=12)
+        self.FONT_12B = ctk.CTkFont(size=12, weight="bold")
+        self.FONT_14 = ctk.CTkFont(size=14)
+        self.FONT_16B = ctk.CTkFont(size=16, weight="bold")
+        self.FONT_18B = ctk.CTkFont(size=18, weight="bold")
         
         # Bind window close event for proper tray cleanup
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.tray_running = False
 
         try:
+            # Config location is resolved once; the directory is created up front
+            self._config_dir = os.path.expanduser("~/.download_manager")
+            self._config_file = os.path.join(self._config_dir, "settings.json")
+            os.makedirs(self._config_dir, exist_ok=True)
+
             # Load settings
             t = time.time()
             settings = self._load_settings()
@@ -98,6 +295,9 @@ class DownloadManagerUI(ctk.CTk):
             t = time.time()
             self.download_folder = settings.get('download_folder', os.path.expanduser("~/Downloads"))
             self.download_folder = os.path.normpath(self.download_folder)
+            # Folder labels follow this variable; writes to it are persisted
+            self.download_folder_var = ctk.StringVar(value=self.download_folder)
+            self.download_folder_var.trace_add("write", self._on_download_folder_changed)
 
             print(f"Step 4: Load download folder took {time.time() - t:.3f}s")
 
@@ -128,26 +328,47 @@ class DownloadManagerUI(ctk.CTk):
 
             # Initialize data structures
             t = time.time()
-            self.progress_queue = queue.Queue()
+            self.item_progress = {}  # item_id -> AggregatingProgress
             self.download_queue = []
-            self.current_download = None
+            self.active_downloads = set()
+            self.pending_downloads = []  # started by the user while all slots were busy
+            # Queued items in arrival order; stale entries are skipped by status and pruned on removal
+            self._queued = collections.deque()
+            self.max_concurrent_downloads = self._load_setting('max_concurrent_downloads', 3)
+            self._queue_dirty = False
+            self._queue_refresh_scheduled = False
+            # Ids of Completed/Cancelled/Error items, updated where the status changes
+            self._completed_ids = set()
+
+            # Queue items run on a persistent pool instead of a new thread per download
+            self._download_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DOWNLOAD_WORKERS, thread_name_prefix="dl-orch")
             
             # Initialize history manager directly
             from download_history import DownloadHistory
             self.history_manager = DownloadHistory()
-           
+
+            # History records from download threads are written by a dedicated writer thread
+            self._history_queue = queue.Queue(maxsize=1024)
+            self._history_thread = threading.Thread(target=self._history_writer, daemon=True)
+            self._history_thread.start()
 
             # Tracking variables
-            self.thread_speed = []
-            self.thread_percents = []
-            self.downloader_paused = False
+            self.thread_speed = array.array('d')
+            self.thread_percents = array.array('d')
             print(f"Step 7: Initialize data structures took {time.time() - t:.3f}s") 
             
             t = time.time()
             self._create_widgets()
             print(f"Step 8: Create widgets took {time.time() - t:.3f}s")
 
-            self.after(100, self.update_thread_display)
+            # Thread display refreshes are driven by progress events, not polling
+            self._thread_ui_pending = False
+
+            # Tagged events from worker threads, drained on the Tk thread.
+            # deque append/popleft are atomic, so producers never take a lock.
+            self._ui_events = collections.deque()
+            self._ui_events_pending = False
             
              # Create system tray icon if enabled
             if self._load_setting('minimize_to_tray', False) and SYSTEM_TRAY_AVAILABLE:
@@ -212,7 +433,8 @@ class DownloadManagerUI(ctk.CTk):
         # Add to queue (same as manual add)
         download_item = DownloadItem(url, self.download_folder, filename or None)
         self.download_queue.append(download_item)
-        self._update_queue_display()
+        self._queued.append(download_item)
+        self._request_queue_refresh()
         print(f"📥 Added from browser API: {url}")
 
     def stop_api_server(self):
@@ -243,15 +465,47 @@ class DownloadManagerUI(ctk.CTk):
             if hasattr(self, '_updating_tooltip'):
                 self._updating_tooltip = False
             
-            # Clean up active downloads
-            for item in self.download_queue:
-                if item.downloader and item.status == "Downloading":
-                    item.downloader.paused = True
-            
-            # Destroy the window
-            self.destroy()
+            # Workers check this before scheduling anything on the window
+            self._closing = True
+
+            # Cancel everything still holding a pool worker, including items no longer in the queue
+            for item in list(self.active_downloads):
+                if item.status != "Cancelled":
+                    item.status = "Cancelled"
+                    self._queue_history_record(
+                        url=item.url,
+                        filename=item.filename,
+                        file_size=0,
+                        status="Cancelled",
+                        speed=0,
+                        error_msg="Cancelled on exit"
+                    )
+                if item.downloader:
+                    item.downloader.cancel()
+            # Nothing waits in the pool beyond the slot limit, so there are no futures to cancel
+            self._download_executor.shutdown(wait=False)
+
+            # Drop pending redraws so nothing runs against a half-destroyed widget tree
+            for handle in (self._thread_ui_handle, self._queue_refresh_handle):
+                if handle is not None:
+                    self.after_cancel(handle)
+
+            # Write any settings still waiting on the debounce timer
+            if self._flush_handle is not None:
+                self.after_cancel(self._flush_handle)
+            self._flush_settings()
+
+            # Let the history writer drain what is already queued, then stop it
+            try:
+                self._history_queue.put(None, timeout=1)
+            except queue.Full:
+                print("⚠ History queue full at exit, pending records were not written")
+            self._history_thread.join(timeout=2)
         except Exception as e:
             print(f"Close error: {e}")
+        finally:
+            # Destroy the window even if a cleanup step failed
+            self.destroy()
 
     def _on_minimize(self, event):
         """Handle window minimize event"""
@@ -259,42 +513,6 @@ class DownloadManagerUI(ctk.CTk):
             if self.tray_icon:
                 self.withdraw()
 
-    def _save_theme_preference(self, theme):
-        """Save theme preference to file for persistence"""
-        try:
-            config_dir = os.path.expanduser("~/.download_manager")
-            os.makedirs(config_dir, exist_ok=True)
-            
-            config_file = os.path.join(config_dir, "settings.json")
-            config = {}
-            
-            # Load existing config if available
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            
-            # Update theme setting
-            config['theme'] = theme
-            
-            # Save config
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-                
-        except Exception as e:
-            print(f"Could not save theme preference: {e}")
-
-    def _load_theme_preference(self):
-        """Load saved theme preference"""
-        try:
-            config_file = os.path.expanduser("~/.download_manager/settings.json")
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('theme', 'Dark')
-        except Exception as e:
-            print(f"Could not load theme preference: {e}")
-        return "Dark"  # Default theme
-
     def _load_language(self, lang_code):
         """Load language strings with fallback support"""
         try:
@@ -387,9 +605,8 @@ class DownloadManagerUI(ctk.CTk):
 
     def _quit_from_tray(self, icon, item):
         """Quit application from tray"""
-        if hasattr(self, 'tray_icon'):
-            self.tray_icon.stop()
-        self.destroy()
+        # on_closing stops the tray, cancels downloads and flushes pending settings
+        self.after(0, self.on_closing)
     
     def _resume_all_from_tray(self, icon, item):
         """Resume all paused downloads from tray - FIXED"""
@@ -404,7 +621,8 @@ class DownloadManagerUI(ctk.CTk):
                 item.status = "Downloading"
             elif not item.downloader:
                 item.status = "Queued"
-        self._update_queue_display()
+                self._queued.append(item)
+        self._request_queue_refresh()
         self.status_label.configure(text=f"Resumed {len(paused)} downloads", text_color="white")
     
     def update_tray_tooltip(self):
@@ -439,7 +657,10 @@ class DownloadManagerUI(ctk.CTk):
         """Start all queued downloads"""
         queued = [i for i in self.download_queue if i.status == "Queued"]
         for item in queued:
-            self._start_download_item(item)
+            if self._free_download_slots() > 0:
+                self._start_download_item(item)
+            elif item not in self.pending_downloads:
+                self.pending_downloads.append(item)
 
     def _pause_all_downloads(self):
         """Pause all active downloads"""
@@ -448,7 +669,7 @@ class DownloadManagerUI(ctk.CTk):
             if item.downloader:
                 item.downloader.pause()
                 item.status = "Paused"
-        self._update_queue_display()
+        self._request_queue_refresh()
 
     def minimize_to_tray(self):
         """Minimize window to system tray"""
@@ -483,7 +704,13 @@ class DownloadManagerUI(ctk.CTk):
             self._create_download_section(left_frame)
             self._create_queue_section(right_frame)
         except Exception as e:
-            messagebox.showerror(self._s('ui_error'), self._s('ui_error_msg', str(e)))
+            self._log_error("Failed to create widgets", e)
+
+    def _log_error(self, context, exc):
+        """Report a widget-building error without a modal dialog"""
+        _log.error("%s: %s", context, exc)
+        if hasattr(self, 'status_label'):
+            self.status_label.configure(text=f"{context}: {exc}", text_color="red")
 
     def cleanup_downloaded_files(self):
         """Cleanup downloaded files with selective options"""
@@ -506,7 +733,7 @@ class DownloadManagerUI(ctk.CTk):
             cleanup_window.grab_set()
             
             ctk.CTkLabel(cleanup_window, text="Select files to delete:",
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                        font=self.FONT_16B).pack(pady=10)
             
             # Scrollable frame for file list
             files_frame = ctk.CTkScrollableFrame(cleanup_window)
@@ -605,21 +832,32 @@ class DownloadManagerUI(ctk.CTk):
             tab_view = ctk.CTkTabview(pref_window)
             tab_view.pack(fill="both", expand=True, padx=10, pady=10)
             
-            # Appearance Tab
-            appearance_tab = tab_view.add(self._s('appearance'))
-            self._create_appearance_tab(appearance_tab)
-            
-            # Download Tab
-            download_tab = tab_view.add(self._s('download_settings'))
-            self._create_download_tab(download_tab)
+            # Tab name -> (frame, builder); contents are built on first select
+            builders = (
+                (self._s('appearance'), self._create_appearance_tab),
+                (self._s('download_settings'), self._create_download_tab),
+                (self._s('general'), self._create_general_tab),
+            )
+            self._pref_tabs = {name: (tab_view.add(name), builder) for name, builder in builders}
+            self._pref_built = set()
+            self._pref_tab_view = tab_view
+            tab_view.configure(command=self._on_pref_tab_changed)
             
-            # General Tab
-            general_tab = tab_view.add(self._s('general'))
-            self._create_general_tab(general_tab)
+            # Appearance is the tab shown first, so build it right away
+            self._on_pref_tab_changed()
             
         except Exception as e:
             messagebox.showerror(self._s('preferences_error'), self._s('preferences_error_msg').format(str(e)))
 
+    def _on_pref_tab_changed(self):
+        """Build a preferences tab the first time it is selected"""
+        name = self._pref_tab_view.get()
+        if name in self._pref_built:
+            return
+        self._pref_built.add(name)
+        tab, builder = self._pref_tabs[name]
+        builder(tab)
+
     def _create_appearance_tab(self, parent):
         """Create appearance settings tab"""
         try:
@@ -628,13 +866,13 @@ class DownloadManagerUI(ctk.CTk):
             theme_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(theme_frame, text="Theme Settings", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Current theme display
             current_theme = ctk.get_appearance_mode()
             self.current_theme_label = ctk.CTkLabel(theme_frame, 
                                                 text=f"Current Theme: {current_theme}",
-                                                font=ctk.CTkFont(size=14))
+                                                font=self.FONT_14)
             self.current_theme_label.pack(anchor="w", pady=5)
             
             # Theme toggle button
@@ -646,7 +884,7 @@ class DownloadManagerUI(ctk.CTk):
             
             # Theme selection (alternative method)
             ctk.CTkLabel(theme_btn_frame, text="Or select:", 
-                        font=ctk.CTkFont(size=12)).pack(side="left", padx=(20, 10))
+                        font=self.FONT_12).pack(side="left", padx=(20, 10))
             
             theme_var = ctk.StringVar(value=current_theme)
             theme_combo = ctk.CTkComboBox(theme_btn_frame, 
@@ -661,24 +899,24 @@ class DownloadManagerUI(ctk.CTk):
             scale_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(scale_frame, text="UI Scaling", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             ctk.CTkLabel(scale_frame, text="Adjust UI scaling (requires restart):",
-                        font=ctk.CTkFont(size=12)).pack(anchor="w", pady=5)
+                        font=self.FONT_12).pack(anchor="w", pady=5)
             
             current_scale = self._load_setting('ui_scale',1.0)
             scale_percent = f"{int(current_scale * 100)}%"
 
             scale_var = ctk.StringVar(value=scale_percent)
             scale_combo = ctk.CTkComboBox(scale_frame,
-                                        values=["80%", "90%", "100%", "110%", "120%"],
+                                        values=UI_SCALE_VALUES,
                                         variable=scale_var,
                                         command=self.change_ui_scale,
                                         width=100)
             scale_combo.pack(anchor="w", pady=5)
             
         except Exception as e:
-            print(f"Appearance tab error: {e}")
+            self._log_error("Appearance tab error", e)
 
     def _create_download_tab(self, parent):
         """Create download settings tab"""
@@ -688,18 +926,18 @@ class DownloadManagerUI(ctk.CTk):
             folder_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(folder_frame, text="Download Location", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Current folder display
             folder_display_frame = ctk.CTkFrame(folder_frame, fg_color="transparent")
             folder_display_frame.pack(fill="x", pady=5)
             
             ctk.CTkLabel(folder_display_frame, text="Current folder:", 
-                        font=ctk.CTkFont(size=12)).pack(anchor="w")
+                        font=self.FONT_12).pack(anchor="w")
             
             self.pref_folder_label = ctk.CTkLabel(folder_display_frame, 
-                                                text=self.download_folder,
-                                                font=ctk.CTkFont(size=11),
+                                                textvariable=self.download_folder_var,
+                                                font=self.FONT_11,
                                                 text_color="gray",
                                                 wraplength=400)
             self.pref_folder_label.pack(anchor="w", pady=2)
@@ -712,7 +950,7 @@ class DownloadManagerUI(ctk.CTk):
             behavior_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(behavior_frame, text="Download Behavior", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Auto-start downloads
             self.auto_start_var = ctk.BooleanVar(value=self._load_setting('auto_start', False))
@@ -735,7 +973,7 @@ class DownloadManagerUI(ctk.CTk):
             categorize_frame.pack(fill="x", padx=10, pady=10)
 
             ctk.CTkLabel(categorize_frame, text="Auto‑Categorization", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
 
             self.auto_categorize_var = ctk.BooleanVar(value=self._load_setting('auto_categorize', False))
             auto_categorize_cb = ctk.CTkCheckBox(categorize_frame, 
@@ -749,22 +987,42 @@ class DownloadManagerUI(ctk.CTk):
             thread_frame.pack(fill="x", pady=10)
             
             ctk.CTkLabel(thread_frame, text="Default Threads:", 
-                        font=ctk.CTkFont(size=12)).pack(side="left", padx=(0, 10))
+                        font=self.FONT_12).pack(side="left", padx=(0, 10))
             
             self.thread_var = ctk.StringVar(value=str(self._load_setting('default_threads', 8)))
             thread_combo = ctk.CTkComboBox(thread_frame,
-                                        values=["1", "2", "4", "8", "12", "16"],
+                                        values=THREAD_VALUES,
                                         variable=self.thread_var,
                                         command=self.change_default_threads,
                                         width=80)
             thread_combo.pack(side="left")
 
+            # Max concurrent downloads
+            concurrent_frame = ctk.CTkFrame(behavior_frame, fg_color="transparent")
+            concurrent_frame.pack(fill="x", pady=10)
+
+            ctk.CTkLabel(concurrent_frame, text="Max Concurrent Downloads:", 
+                        font=self.FONT_12).pack(side="left", padx=(0, 10))
+
+            concurrent_slider = ctk.CTkSlider(concurrent_frame,
+                                        from_=1, to=DOWNLOAD_WORKERS,
+                                        number_of_steps=DOWNLOAD_WORKERS - 1,
+                                        command=self.change_max_concurrent,
+                                        width=160)
+            concurrent_slider.set(self.max_concurrent_downloads)
+            concurrent_slider.pack(side="left")
+
+            self.concurrent_value_label = ctk.CTkLabel(concurrent_frame, 
+                                        text=str(self.max_concurrent_downloads),
+                                        font=self.FONT_12)
+            self.concurrent_value_label.pack(side="left", padx=10)
+
             # Duplicate Check Section
             duplicate_frame = ctk.CTkFrame(parent)
             duplicate_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(duplicate_frame, text="Duplicate File Handling", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Auto-rename duplicates
             self.auto_rename_var = ctk.BooleanVar(value=self._load_setting('auto_rename', False))
@@ -783,7 +1041,7 @@ class DownloadManagerUI(ctk.CTk):
             skip_duplicates_cb.pack(anchor="w", pady=5)
             
         except Exception as e:
-            print(f"Download tab error: {e}")
+            self._log_error("Download tab error", e)
 
     def toggle_auto_categorize(self):
         self._save_setting('auto_categorize', self.auto_categorize_var.get())
@@ -836,7 +1094,7 @@ class DownloadManagerUI(ctk.CTk):
             item.filename = os.path.basename(new_path)
             # Optionally update history record? The history already stores the original path, but we could update it.
             # For now, we'll just update the item so the queue displays the correct location.
-            self._update_queue_display()
+            self._request_queue_refresh()
             return True
         except Exception as e:
             print(f"Failed to move file: {e}")
@@ -856,7 +1114,7 @@ class DownloadManagerUI(ctk.CTk):
             startup_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(startup_frame, text="Startup", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Start with system
             self.startup_var = ctk.BooleanVar(value=self._load_setting('start_with_system', False))
@@ -870,7 +1128,7 @@ class DownloadManagerUI(ctk.CTk):
             lang_frame = ctk.CTkFrame(parent)
             lang_frame.pack(fill="x", padx=10, pady=10)
 
-            ctk.CTkLabel(lang_frame, text="Language", font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+            ctk.CTkLabel(lang_frame, text="Language", font=self.FONT_16B).pack(anchor="w", pady=5)
 
             self.lang_var = ctk.StringVar(value=self.current_lang)
             lang_combo = ctk.CTkComboBox(lang_frame, values=["en", "es", "fr", "de", "zh"],  # add as needed
@@ -890,7 +1148,7 @@ class DownloadManagerUI(ctk.CTk):
             notif_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(notif_frame, text="Notifications", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             # Download complete notifications
             self.notify_var = ctk.BooleanVar(value=self._load_setting('notify_complete', True))
@@ -913,7 +1171,7 @@ class DownloadManagerUI(ctk.CTk):
             reset_frame.pack(fill="x", padx=10, pady=10)
             
             ctk.CTkLabel(reset_frame, text="Reset & Maintenance", 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=5)
+                        font=self.FONT_16B).pack(anchor="w", pady=5)
             
             reset_btn_frame = ctk.CTkFrame(reset_frame, fg_color="transparent")
             reset_btn_frame.pack(fill="x", pady=10)
@@ -929,31 +1187,12 @@ class DownloadManagerUI(ctk.CTk):
                         width=150).pack(side="left")
             
         except Exception as e:
-            print(f"General tab error: {e}")
+            self._log_error("General tab error", e)
 
     def toggle_theme(self):
-        """Toggle between dark and light theme - USING THREADING"""
-        try:
-            current_theme = ctk.get_appearance_mode()
-            new_theme = "Light" if current_theme == "Dark" else "Dark"
-            
-            # Run theme change in a separate thread
-            threading.Thread(target=self._apply_theme_threaded, args=(new_theme,), daemon=True).start()
-            
-        except Exception as e:
-            messagebox.showerror("Theme Error", f"Failed to switch theme: {str(e)}")
-
-    def _apply_theme_threaded(self, new_theme):
-        """Apply theme change in a separate thread"""
-        try:
-            # This might still block, but in a separate thread
-            ctk.set_appearance_mode(new_theme)
-            
-            # Save settings and update UI in main thread
-            self.after(0, lambda: self._finish_theme_change(new_theme))
-            
-        except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Theme Error", f"Failed to apply theme: {str(e)}"))
+        """Toggle between dark and light theme"""
+        current_theme = ctk.get_appearance_mode()
+        self.change_theme("Light" if current_theme == "Dark" else "Dark")
 
     def _finish_theme_change(self, new_theme):
         """Finish theme change in main thread"""
@@ -973,18 +1212,19 @@ class DownloadManagerUI(ctk.CTk):
 
     def change_theme(self, choice):
         """Change theme via dropdown"""
-        threading.Thread(target=self._apply_theme_threaded, args=(choice,), daemon=True).start()
+        try:
+            # Tk widgets are redrawn on the main thread either way
+            ctk.set_appearance_mode(choice)
+            self.after_idle(self._finish_theme_change, choice)
+        except Exception as e:
+            messagebox.showerror("Theme Error", f"Failed to switch theme: {str(e)}")
 
     def change_ui_scale(self, choice):
         """Change UI scaling (requires restart)"""
         try:
-            scale_map = {"80%": 0.8, "90%": 0.9, "100%": 1.0, "110%": 1.1, "120%": 1.2}
-            selected_scale = scale_map[choice]
+            selected_scale = UI_SCALE_MAP[choice]
             self._save_setting('ui_scale', selected_scale)
 
-            if hasattr(self, 'current_scale_label'):
-                self.current_scale_label.configure(text=f"Current Scale: {choice}")
-
             messagebox.showinfo("Restart Required", "UI scaling change will take effect after restart.")
 
         except Exception as e:
@@ -994,10 +1234,12 @@ class DownloadManagerUI(ctk.CTk):
         """Change download folder from preferences"""
         folder = filedialog.askdirectory(initialdir=self.download_folder)
         if folder:
-            self.download_folder = folder
-            self.folder_path_label.configure(text=folder)
-            self.pref_folder_label.configure(text=folder)
-            self._save_setting('download_folder', folder)
+            self.download_folder_var.set(folder)
+
+    def _on_download_folder_changed(self, *_):
+        """Keep download_folder and the saved setting in step with the folder variable"""
+        self.download_folder = self.download_folder_var.get()
+        self._save_setting('download_folder', self.download_folder)
 
     def toggle_auto_start(self):
         self._save_setting('auto_start', self.auto_start_var.get())
@@ -1008,6 +1250,16 @@ class DownloadManagerUI(ctk.CTk):
     def change_default_threads(self, choice):
         self._save_setting('default_threads', int(choice))
 
+    def change_max_concurrent(self, value):
+        value = int(round(value))
+        if value == self.max_concurrent_downloads:
+            return
+        self.max_concurrent_downloads = value
+        self.concurrent_value_label.configure(text=str(value))
+        self._save_setting('max_concurrent_downloads', value)
+        # A raised limit may free slots for waiting items
+        self._check_and_start_next_download()
+
     def toggle_startup(self):
         self._save_setting('start_with_system', self.startup_var.get())
 
@@ -1024,6 +1276,7 @@ class DownloadManagerUI(ctk.CTk):
         """Reset all settings to defaults"""
         if messagebox.askyesno("Confirm Reset", "Reset all settings to default values?"):
             # Clear settings file
+            self._discard_pending_settings()
             config_file = self._get_config_file()
             if os.path.exists(config_file):
                 os.remove(config_file)
@@ -1061,7 +1314,8 @@ class DownloadManagerUI(ctk.CTk):
                             deleted_files += 1
                 
                 # Clear all data
-                config_dir = os.path.dirname(self._get_config_file())
+                self._discard_pending_settings()
+                config_dir = self._config_dir
                 if os.path.exists(config_dir):
                     import shutil
                     shutil.rmtree(config_dir)
@@ -1077,49 +1331,70 @@ class DownloadManagerUI(ctk.CTk):
 
     def _get_config_file(self):
         """Get config file path"""
-        config_dir = os.path.expanduser("~/.download_manager")
-        os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(config_dir, "settings.json")
+        return self._config_file
 
-    def _load_settings(self):
-        """Load all settings from file"""
+    def _load_settings(self, force_reload=False):
+        """Load all settings; the file is read once and then served from memory"""
+        if self._settings is not None and not force_reload:
+            return self._settings
+        settings = {}
         try:
             config_file = self._get_config_file()
             if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+                with open(config_file, 'rb') as f:
+                    data = f.read()
+                settings = orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             print(f"Settings load error: {e}")
-        return {}
+        self._settings = settings
+        return settings
 
     def _load_setting(self, key, default):
         """Load a specific setting"""
-        settings = self._load_settings()
-        return settings.get(key, default)
+        return self._load_settings().get(key, default)
 
     def _save_setting(self, key, value):
-        """Save a setting to file"""
+        """Update a setting; the file write is debounced so rapid changes cost one write"""
+        self._load_settings()[key] = value
+        self._settings_dirty = True
+        if self._flush_handle is not None:
+            self.after_cancel(self._flush_handle)
+        self._flush_handle = self.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write pending settings to disk atomically"""
+        self._flush_handle = None
+        if not self._settings_dirty:
+            return
+        config_file = self._get_config_file()
+        tmp_file = config_file + ".tmp"
         try:
-            config_file = self._get_config_file()
-            settings = self._load_settings()
-            settings[key] = value
-            
-            with open(config_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # The directory is only missing after "Clear All Data" removed it
+            os.makedirs(self._config_dir, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(self._settings, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+            self._settings_dirty = False
         except Exception as e:
             print(f"Settings save error: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def _discard_pending_settings(self):
+        """Forget unsaved setting changes, e.g. when the settings file is being removed"""
+        if self._flush_handle is not None:
+            self.after_cancel(self._flush_handle)
+            self._flush_handle = None
+        self._settings_dirty = False
+        self._settings = {}
 
     def load_theme_preference(self):
-        """Load saved theme preference - keep your exisiting method"""
-        try:
-            config_file = self._get_config_file()
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('theme', 'Dark')
-        except Exception as e:
-            print(f"Could not load theme preference: {e}")
-        return "Dark"
+        """Load saved theme preference"""
+        return self._load_setting('theme', 'Dark')
 
     def _create_download_section(self, parent):
         """Create download controls section"""
@@ -1128,12 +1403,12 @@ class DownloadManagerUI(ctk.CTk):
             folder_frame = ctk.CTkFrame(parent)
             folder_frame.pack(fill="x", pady=(0, 10))
             
-            ctk.CTkLabel(folder_frame, text=self._s('download_folder'), font=ctk.CTkFont(size=14)).pack(anchor="w")
+            ctk.CTkLabel(folder_frame, text=self._s('download_folder'), font=self.FONT_14).pack(anchor="w")
             
             folder_select_frame = ctk.CTkFrame(folder_frame)
             folder_select_frame.pack(fill="x", pady=5)
             
-            self.folder_path_label = ctk.CTkLabel(folder_select_frame, text=self._s('download_folder'), 
+            self.folder_path_label = ctk.CTkLabel(folder_select_frame, textvariable=self.download_folder_var, 
                                                 anchor="w", width=300, wraplength=400)
             self.folder_path_label.pack(side="left", fill="x", expand=True)
             
@@ -1141,9 +1416,9 @@ class DownloadManagerUI(ctk.CTk):
                          command=self.select_download_folder).pack(side="right", padx=(5, 0))
             
             # URL Section
-            ctk.CTkLabel(parent, text=self._s('download_url'), font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(10, 0))
+            ctk.CTkLabel(parent, text=self._s('download_url'), font=self.FONT_14).pack(anchor="w", pady=(10, 0))
             
-            self.url_entry = ctk.CTkEntry(parent, width=400, font=ctk.CTkFont(size=12))
+            self.url_entry = ctk.CTkEntry(parent, width=400, font=self.FONT_12)
             self.url_entry.pack(fill="x", pady=5)
             self.url_entry.bind("<Return>", lambda e: self.add_to_queue())
             
@@ -1154,9 +1429,9 @@ class DownloadManagerUI(ctk.CTk):
             batch_frame = ctk.CTkFrame(parent)
             batch_frame.pack(fill="x", pady=10)
             
-            ctk.CTkLabel(batch_frame, text=self._s('batch_download'), font=ctk.CTkFont(size=14)).pack(anchor="w")
+            ctk.CTkLabel(batch_frame, text=self._s('batch_download'), font=self.FONT_14).pack(anchor="w")
             
-            self.batch_text = ctk.CTkTextbox(batch_frame, height=100, font=ctk.CTkFont(size=12))
+            self.batch_text = ctk.CTkTextbox(batch_frame, height=100, font=self.FONT_12)
             self.batch_text.pack(fill="x", pady=5)
 
             # Right-click menu for batch text
@@ -1194,7 +1469,7 @@ class DownloadManagerUI(ctk.CTk):
 
             # Selection info label
             self.selection_info_label = ctk.CTkLabel(parent, text=self._s('no_items_selected'), 
-                                                   text_color="gray", font=ctk.CTkFont(size=11))
+                                                   text_color="gray", font=self.FONT_11)
             self.selection_info_label.pack(anchor="w", pady=(5, 0))
             
             # Update the _update_main_button_states to also update this label:
@@ -1227,44 +1502,54 @@ class DownloadManagerUI(ctk.CTk):
             self.preference_btn.pack(side="left",padx=5)
 
             # Status Section
-            self.status_label = ctk.CTkLabel(parent, text=self._s('idle'), text_color="gray", font=ctk.CTkFont(size=12))
+            self.status_label = ctk.CTkLabel(parent, text=self._s('idle'), text_color="gray", font=self.FONT_12)
             self.status_label.pack(anchor="w", pady=5)
             
             # Overall Progress
             progress_frame = ctk.CTkFrame(parent)
             progress_frame.pack(fill="x", pady=10)
             
-            self.overall_label = ctk.CTkLabel(progress_frame, text=self._s('overall').format(0), font=ctk.CTkFont(size=12))
+            self.overall_label = ctk.CTkLabel(progress_frame, text=self._s('overall').format(0), font=self.FONT_12)
             self.overall_label.pack(anchor="w")
             
-            self.overall_speed_label = ctk.CTkLabel(progress_frame, text=self._s('speed').format(0.00), font=ctk.CTkFont(size=12))
+            self.overall_speed_label = ctk.CTkLabel(progress_frame, text=self._s('speed').format(0.00), font=self.FONT_12)
             self.overall_speed_label.pack(anchor="w")
             
             self.overall_progress = ctk.CTkProgressBar(progress_frame, mode="determinate")
             self.overall_progress.set(0)
             self.overall_progress.pack(fill="x", pady=5)
+            # Bar width is read on resize only; updates use it to skip sub-pixel moves
+            self._progress_width = 1
+            self._last_progress = 0.0
+            self.overall_progress.bind(
+                "<Configure>", lambda e: setattr(self, '_progress_width', max(1, e.width)))
             
             # Current file info
-            self.current_file_label = ctk.CTkLabel(progress_frame, text=self._s('current_none'), text_color="gray", font=ctk.CTkFont(size=12))
+            self.current_file_label = ctk.CTkLabel(progress_frame, text=self._s('current_none'), text_color="gray", font=self.FONT_12)
             self.current_file_label.pack(anchor="w")
             
             # Thread Status Section
             thread_frame = ctk.CTkFrame(parent)
             thread_frame.pack(fill="both", expand=True, pady=10)
             
-            ctk.CTkLabel(thread_frame, text=self._s('thread_status'), font=ctk.CTkFont(size=14)).pack(anchor="w")
+            ctk.CTkLabel(thread_frame, text=self._s('thread_status'), font=self.FONT_14).pack(anchor="w")
             
             self.thread_scrollable_frame = ctk.CTkScrollableFrame(thread_frame, height=150)
             self.thread_scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
             
+            # Labels are created the first time a download needs them, then kept in
+            # their grid slots and only revealed/hidden
             self.thread_labels = []
+            self._last_shown = []  # (speed, percent) last drawn per thread label
+            self._thread_prefix = []  # "Thread N: " per label, built with the label
+            self._visible_thread_labels = 0
         except Exception as e:
-            messagebox.showerror("UI Error", f"Failed to create download section: {str(e)}")
+            self._log_error("Failed to create download section", e)
 
     def _create_queue_section(self, parent):
         """Create download queue management section"""
         try:
-            ctk.CTkLabel(parent, text=self._s('download_queue'), font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+            ctk.CTkLabel(parent, text=self._s('download_queue'), font=self.FONT_16B).pack(pady=10)
             
             # ✅ ADD SELECTION CONTROLS FRAME
             selection_frame = ctk.CTkFrame(parent)
@@ -1312,48 +1597,54 @@ class DownloadManagerUI(ctk.CTk):
                         command=self.clear_all_queue, width=80).pack(side="right")
             
             # Queue list with proper height
-            ctk.CTkLabel(parent, text=self._s('downloads'), font=ctk.CTkFont(size=14)).pack(anchor="w", padx=10, pady=(5, 0))
+            ctk.CTkLabel(parent, text=self._s('downloads'), font=self.FONT_14).pack(anchor="w", padx=10, pady=(5, 0))
             
             self.queue_frame = ctk.CTkScrollableFrame(parent, height=300)  # Increased height
             self.queue_frame.pack(fill="both", expand=True, padx=10, pady=10)
             
             self.queue_item_frames = []
-            self.queue_item_widgets = {}
+            self.queue_item_widgets = {}  # item_id -> row widgets, reused across refreshes
+            self._queue_row_order = []  # item_ids in on-screen packing order
             
         except Exception as e:
-            messagebox.showerror("UI Error", f"Failed to create queue section: {str(e)}")
+            self._log_error("Failed to create queue section", e)
 
     def show_menu(self, event):
         """Show right-click context menu for text widgets"""
+        menu = None
         try:
-            # Get the widget that was clicked
-            widget = event.widget
+            # One menu serves every text widget; commands act on the widget clicked last
+            self._menu_target = event.widget
+            menu = self._get_edit_menu()
+            menu.tk_popup(event.x_root, event.y_root)
             
-            # Create menu
+        except Exception as e:
+            print(f"Menu error: {e}")
+        finally:
+            try:
+                menu.grab_release()
+            except:
+                pass
+
+    def _get_edit_menu(self):
+        """Build the shared Cut/Copy/Paste/Select All menu on first use"""
+        if self._edit_menu is None:
             menu = tk.Menu(self, tearoff=0)
             
             # Cut, Copy, Paste work the same way
             menu.add_command(label="Cut", 
-                            command=lambda: widget.event_generate("<<Cut>>"))
+                            command=lambda: self._menu_target.event_generate("<<Cut>>"))
             menu.add_command(label="Copy", 
-                            command=lambda: widget.event_generate("<<Copy>>"))
+                            command=lambda: self._menu_target.event_generate("<<Copy>>"))
             menu.add_command(label="Paste", 
-                            command=lambda: widget.event_generate("<<Paste>>"))
+                            command=lambda: self._menu_target.event_generate("<<Paste>>"))
             menu.add_separator()
             
             # Select All works differently
             menu.add_command(label="Select All", 
-                            command=lambda: self._select_all_in_widget(widget))
-            
-            menu.tk_popup(event.x_root, event.y_root)
-            
-        except Exception as e:
-            print(f"Menu error: {e}")
-        finally:
-            try:
-                menu.grab_release()
-            except:
-                pass
+                            command=lambda: self._select_all_in_widget(self._menu_target))
+            self._edit_menu = menu
+        return self._edit_menu
 
     def _select_all_in_widget(self, widget):
         """Handle Select All for different widget types"""
@@ -1368,8 +1659,7 @@ class DownloadManagerUI(ctk.CTk):
         try:
             folder = filedialog.askdirectory(initialdir=self.download_folder)
             if folder:
-                self.download_folder = folder
-                self.folder_path_label.configure(text=folder)
+                self.download_folder_var.set(folder)
         except Exception as e:
             messagebox.showerror("Folder Selection Error", f"Failed to select folder: {str(e)}")
 
@@ -1381,17 +1671,17 @@ class DownloadManagerUI(ctk.CTk):
                 messagebox.showwarning("Warning", "Please enter a URL")
                 return
             
-            if not url.startswith(('http://', 'https://')):
+            if not _URL_RE.match(url):
                 messagebox.showwarning("Invalid URL", "Please enter a valid HTTP/HTTPS URL")
                 return
             
 
             # 🔥 CHECK FOR DUPLICATE WHEN ADDING TO QUEUE 🔥
-            filename = os.path.basename(url) or "downloaded_file"
+            filename = _filename_from_url(url)
             duplicate_action = self.check_duplicate_file(filename, url)
             
             if duplicate_action == "skip":
-                messagebox.showinfo("Skipped", f"Skipped duplicate file: {filename}")
+                self._flash_status(f"Skipped duplicate file: {filename}", "orange")
                 return
             elif duplicate_action == "rename":
                 filename = self.generate_unique_filename(filename)
@@ -1402,15 +1692,16 @@ class DownloadManagerUI(ctk.CTk):
             
             download_item = DownloadItem(url, self.download_folder, filename)
             self.download_queue.append(download_item)
+            self._queued.append(download_item)
             
             print("=== AFTER ADDING TO QUEUE ===")
             self.debug_queue_state()
 
             # Single update call
-            self._update_queue_display()
+            self._request_queue_refresh()
             
             self.url_entry.delete(0, 'end')
-            messagebox.showinfo("Success", f"Added to queue: {url}")
+            self._flash_status(f"Queued: {url[:60]}")
             
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to add URL to queue: {str(e)}")   
@@ -1423,51 +1714,111 @@ class DownloadManagerUI(ctk.CTk):
                 messagebox.showwarning("Warning", "Please enter URLs in the batch box")
                 return
             
-            urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
-            added_count = 0
-            invalid_urls = []
-            skipped_duplicates = []
-            
+            lines = urls_text.splitlines()
+            self.batch_text.delete("1.0", "end")
 
-            for url in urls:
-                if url and url.startswith(('http://', 'https://')):
+            if len(lines) > BATCH_PARSE_THRESHOLD:
+                # Large paste: build the items on a worker and append them when ready
+                self.status_label.configure(text=f"Queueing {len(lines)} URLs...", text_color="white")
+                download_folder = self.download_folder
+
+                def parse_worker():
+                    try:
+                        items, invalid_urls = self._parse_batch_urls(lines, download_folder)
+                        self.after(0, lambda: self._append_items(items, invalid_urls))
+                    except Exception as e:
+                        # Bind the text now; 'e' is unbound once the except block ends
+                        msg = f"Failed to add batch URLs: {str(e)}"
+                        self.after(0, lambda: messagebox.showerror("Batch Error", msg))
+
+                threading.Thread(target=parse_worker, daemon=True).start()
+            else:
+                items, invalid_urls = self._parse_batch_urls(lines, self.download_folder)
+                self._append_items(items, invalid_urls)
+        except Exception as e:
+            messagebox.showerror("Batch Error", f"Failed to add batch URLs: {str(e)}")
 
-                    # 🔥 CHECK FOR DUPLICATE FOR EACH URL 🔥
-                    filename = os.path.basename(url) or "downloaded_file"
-                    duplicate_action = self.check_duplicate_file(filename, url)
-                    
-                    if duplicate_action == "skip":
-                        skipped_duplicates.append(url)
-                        continue
-                    elif duplicate_action == "rename":
-                        filename = self.generate_unique_filename(filename)
+    def _flash_status(self, text, color="green"):
+        """Show a short non-blocking status message, then fall back to Idle"""
+        self.status_label.configure(text=text, text_color=color)
+
+        def reset():
+            # Leave the label alone if a download has taken it over meanwhile
+            if not self.active_downloads and self.status_label.cget("text") == text:
+                self.status_label.configure(text="Idle", text_color="gray")
+
+        self.after(2000, reset)
+
+    def _parse_batch_urls(self, lines, download_folder):
+        """Validate pasted lines and build DownloadItems; safe to run off the UI thread"""
+        items = []
+        invalid_urls = []
+        added_time = datetime.now()  # one timestamp for the whole batch
+        # One strip per line; blank lines are dropped before classification
+        stripped = (url for url in (line.strip() for line in lines) if url)
+        for url in stripped:
+            if _URL_RE.match(url):
+                items.append(DownloadItem(url, download_folder, added_time=added_time))
+            else:
+                invalid_urls.append(url)
+        return items, invalid_urls
+
+    def _append_items(self, items, invalid_urls):
+        """Resolve duplicates and append parsed batch items to the queue (UI thread)"""
+        try:
+            accepted = []
+            skipped_duplicates = []
+
+            for item in items:
+                # 🔥 CHECK FOR DUPLICATE FOR EACH URL 🔥
+                duplicate_action = self.check_duplicate_file(item.filename, item.url)
+                
+                if duplicate_action == "skip":
+                    skipped_duplicates.append(item.url)
+                    continue
+                elif duplicate_action == "rename":
+                    item.filename = self.generate_unique_filename(item.filename)
 
-                    download_item = DownloadItem(url, self.download_folder, filename)
-                    self.download_queue.append(download_item)
-                    added_count += 1
-                elif url.strip():  # Non-empty but invalid URL
-                    invalid_urls.append(url)
+                accepted.append(item)
             
-            self._update_queue_display()
-            self.batch_text.delete("1.0", "end")
+            # Grow the queue once for the whole batch
+            self.download_queue.extend(accepted)
+            self._queued.extend(accepted)
+            added_count = len(accepted)
+            self._request_queue_refresh()
             
             message = f"Added {added_count} URLs to queue"
+            if skipped_duplicates:
+                message += f", skipped {len(skipped_duplicates)} duplicate(s)"
             if invalid_urls:
-                message += f"\n\nInvalid URLs ignored:\n" + "\n".join(invalid_urls[:5])  # Show max 5 invalid URLs
-                if len(invalid_urls) > 5:
-                    message += f"\n... and {len(invalid_urls) - 5} more"
+                message += f", ignored {len(invalid_urls)} invalid"
+                print("Invalid URLs ignored:\n" + "\n".join(invalid_urls))
             
-            messagebox.showinfo("Batch Add Result", message)
+            self._flash_status(message)
         except Exception as e:
             messagebox.showerror("Batch Error", f"Failed to add batch URLs: {str(e)}")
 
-    def _update_queue_display(self):
+    def _request_queue_refresh(self):
+        """Schedule one coalesced queue refresh; repeated calls before it runs are merged"""
+        self._queue_dirty = True
+        if not self._queue_refresh_scheduled:
+            self._queue_refresh_scheduled = True
+            self._queue_refresh_handle = self.after(QUEUE_REFRESH_MS, self._do_queue_refresh)
+
+    def _do_queue_refresh(self):
         """Update the queue display without blinking"""
+        # All row changes land in this one callback; Tk lays them out and redraws
+        # once when it next goes idle. Never call update()/update_idletasks() from
+        # the queue or progress paths - they re-enter the event loop mid-refresh.
+        self._queue_refresh_scheduled = False
+        if not self._queue_dirty:
+            return
         try:
 
             if hasattr(self, '_updating_queue') and self._updating_queue:
                 return
             self._updating_queue = True
+            self._queue_dirty = False
 
             # Always refresh rather than recreate to prevent flickering
             self._refresh_queue_display()
@@ -1492,15 +1843,47 @@ class DownloadManagerUI(ctk.CTk):
         print(f"===================")
 
     def _refresh_queue_display(self):
-        """Update existing queue items without recreating"""
+        """Update existing queue items in place, creating or destroying only rows that changed"""
         try:
-            # Clear existing queue display
-            for widget in self.queue_frame.winfo_children():
-                widget.destroy()
-            
-            # Create new queue items with proper sizing
+            rows = self.queue_item_widgets
+            live_ids = set()
+            created = 0
+
             for i, item in enumerate(self.download_queue):
-                self._create_queue_item(i, item)
+                live_ids.add(item.item_id)
+                row = rows.get(item.item_id)
+
+                # A status change swaps the checkbox and action buttons; the labels stay
+                if row is not None and row['status'] != item.status:
+                    self._build_queue_item_controls(row, item)
+
+                if row is None:
+                    # Big batches get their rows over several passes so Tk stays responsive
+                    if created >= QUEUE_ROWS_PER_PASS:
+                        continue
+                    created += 1
+                    row = self._create_queue_item(i, item)
+                    if row is not None:
+                        rows[item.item_id] = row
+                        self._queue_row_order.append(item.item_id)
+                else:
+                    self._update_queue_item(row, item)
+
+            # Drop rows for items that left the queue
+            for item_id in [item_id for item_id in rows if item_id not in live_ids]:
+                self._destroy_queue_row(item_id)
+
+            # Re-pack only when the on-screen order no longer matches the queue
+            order = [item.item_id for item in self.download_queue if item.item_id in rows]
+            if order != self._queue_row_order:
+                for item_id in order:
+                    rows[item_id]['item_frame'].pack_forget()
+                for item_id in order:
+                    rows[item_id]['item_frame'].pack(fill="x", pady=1, padx=1)
+                self._queue_row_order = order
+
+            if len(rows) < len(self.download_queue) and created >= QUEUE_ROWS_PER_PASS:
+                self._request_queue_refresh()
 
         except Exception as e:
             print(f"Queue refresh error: {e}")
@@ -1513,8 +1896,8 @@ class DownloadManagerUI(ctk.CTk):
                 if item.status == "Downloading" and item.downloader:
                     item.downloader.pause()
                     item.status = "Paused"
-                    self._update_queue_display()
-                    print(f"⏸ Paused individual download: {item.filename or item.url}")
+                    self._request_queue_refresh()
+                    print(f"⏸ Paused individual download: {item.filename}")
                 else:
                     print(f"⚠ Cannot pause: Item not downloading or no downloader")
         except Exception as e:
@@ -1528,8 +1911,8 @@ class DownloadManagerUI(ctk.CTk):
                 if item.status == "Paused" and item.downloader:
                     item.downloader.resume()
                     item.status = "Downloading"
-                    self._update_queue_display()
-                    print(f"▶ Resumed individual download: {item.filename or item.url}")
+                    self._request_queue_refresh()
+                    print(f"▶ Resumed individual download: {item.filename}")
                 else:
                     print(f"⚠ Cannot resume: Item not paused or no downloader")
         except Exception as e:
@@ -1544,47 +1927,42 @@ class DownloadManagerUI(ctk.CTk):
                 # Ask for confirmation (only if not already in error/cancelled state)
                 if item.status in ["Queued", "Downloading", "Paused"]:
                     if not messagebox.askyesno("Confirm Cancel", 
-                                            f"Cancel download: {item.filename or os.path.basename(item.url)}?"):
+                                            f"Cancel download: {item.filename}?"):
                         return
                 
                 # Handle based on status
                 if item.status == "Downloading" and item.downloader:
                     # Mark as cancelled and stop the downloader
-                    item.downloader.paused = True  # This will stop download threads
                     item.status = "Cancelled"
+                    self._completed_ids.add(item.item_id)
+                    item.downloader.cancel()  # This will stop download threads
                     item.progress = 0
                     
                     # Record cancellation in history
-                    self.history_manager.add_record(
+                    self._queue_history_record(
                         url=item.url,
-                        filename=item.filename or os.path.basename(item.url),
+                        filename=item.filename,
                         file_size=0,
                         status="Cancelled",
                         speed=0,
                         error_msg="Cancelled by user (individual)"
                     )
                     
-                    # If this was the current active download, move to next
-                    if self.current_download == item:
-                        self._download_item_finished()
-                    
                 elif item.status == "Paused" and item.downloader:
                     item.status = "Cancelled"
+                    self._completed_ids.add(item.item_id)
+                    item.downloader.cancel()
                     item.progress = 0
                     
                     # Record cancellation in history
-                    self.history_manager.add_record(
+                    self._queue_history_record(
                         url=item.url,
-                        filename=item.filename or os.path.basename(item.url),
+                        filename=item.filename,
                         file_size=0,
                         status="Cancelled",
                         speed=0,
                         error_msg="Cancelled by user (individual)"
                     )
-                    
-                    # If this was the current active download, move to next
-                    if self.current_download == item:
-                        self._download_item_finished()
                         
                 elif item.status == "Queued":
                     # Just remove from queue (this will be handled by _remove_from_queue)
@@ -1592,8 +1970,8 @@ class DownloadManagerUI(ctk.CTk):
                     return
                 
                 # Update the queue display to reflect the new status
-                self._update_queue_display()
-                print(f"✕ Cancelled individual download: {item.filename or item.url}")
+                self._request_queue_refresh()
+                print(f"✕ Cancelled individual download: {item.filename}")
                 
         except Exception as e:
             print(f"❌ Error cancelling individual download: {e}")
@@ -1606,26 +1984,34 @@ class DownloadManagerUI(ctk.CTk):
                 
                 # Record cancellation for queued items that are removed
                 if item.status == "Queued":
-                    self.history_manager.add_record(
+                    self._queue_history_record(
                         url=item.url,
-                        filename=item.filename or os.path.basename(item.url),
+                        filename=item.filename,
                         file_size=0,
                         status="Cancelled", 
                         speed=0,
                         error_msg="Removed from queue before download"
                     )
                 
-                # If removing current download, cancel it first
-                if self.current_download == self.download_queue[index]:
-                    self.cancel_current_download(confirm=False)
+                # If removing an active download, stop it first
+                if item in self.active_downloads:
+                    item.status = "Cancelled"
+                    if item.downloader:
+                        item.downloader.cancel()
+
+                # Leave a tombstone so any stale _queued entry is skipped
+                if item.status == "Queued":
+                    item.status = "Cancelled"
                 
+                self._completed_ids.discard(item.item_id)
                 del self.download_queue[index]
-                self._update_queue_display()
+                self._prune_queued()
+                self._request_queue_refresh()
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to remove item: {str(e)}")
 
     def _create_queue_item(self, index, item):
-        """Create a single queue item with selection and individual controls"""
+        """Create a single queue row and return its widgets for in-place updates"""
         try:
             # Main frame for the queue item
             item_frame = ctk.CTkFrame(self.queue_frame, height=80)
@@ -1654,22 +2040,8 @@ class DownloadManagerUI(ctk.CTk):
 
                 if not is_button_or_checkbox:
                     item.selected = not item.selected
-                    # Update checkbox if it exists
-                    if item.selection_checkbox is not None:
-                        item.selection_checkbox.select() if item.selected else item.selection_checkbox.deselect()
-
-                    # Visual feedback
-                    if item.selected:
-                        item_frame.configure(border_width=2, border_color="#FFD700")
-                        filename_label.configure(font=ctk.CTkFont(size=11, weight="bold"))
-                    else:
-                        item_frame.configure(border_width=0)
-                        filename_label.configure(font=ctk.CTkFont(size=11, weight="normal"))
-
-                    if item == self.current_download:
-                        item_frame.configure(border_width=1, border_color="#3B8ED0")
-
-                    self._update_queue_display()
+                    # Row styling is applied by the refresh
+                    self._request_queue_refresh()
             item_frame.bind("<Button-1>", handle_frame_click)
             
             # Content frame
@@ -1680,53 +2052,13 @@ class DownloadManagerUI(ctk.CTk):
             top_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
             top_frame.pack(fill="x", pady=(0, 1))
             
-            # ✅ SELECTION CHECKBOX
-            if item.status in ["Queued", "Downloading", "Paused"]:
-                selection_var = ctk.BooleanVar(value=item.selected)
-                
-                # In _create_queue_item method, update the selection highlighting:
-                def toggle_selection():
-                    item.selected = selection_var.get()
-                    # Visual feedback for selection
-                    if item.selected:
-                        # Highlight selected items with yellow border
-                        item_frame.configure(border_width=2, border_color="#FFD700")  # Gold color for selected
-                        filename_label.configure(font=ctk.CTkFont(size=11))
-                    else:
-                        item_frame.configure(border_width=0)
-                        filename_label.configure(font=ctk.CTkFont(size=11, weight="normal"))
-                    
-                    # Also highlight if this is the current active download
-                    if item == self.current_download:
-                        item_frame.configure(border_width=1, border_color="#3B8ED0")  # Blue for current
-
-                    self._update_queue_display()
-            
-                selection_cb = ctk.CTkCheckBox(
-                    top_frame, 
-                    text="", 
-                    variable=selection_var,
-                    command=toggle_selection,
-                    width=20
-                )
-                selection_cb.pack(side="left", padx=(0, 5))
-                selection_cb.bind("<Button-1>", lambda e: "break")  # Prevent frame click
-                item.selection_checkbox = selection_cb
-            else:
-                # For completed items, add a placeholder to align
-                placeholder = ctk.CTkLabel(top_frame, text="", width=20)
-                placeholder.pack(side="left", padx=(0, 5))
-                item.selection_checkbox = None  # No checkbox for completed items
-                selection_cb = None  # Set to None for else branch
+            display_filename, status_text, status_color, timestamp_info = self._queue_item_texts(item)
             
             # Filename (expanded area)
-            filename = item.filename or os.path.basename(item.url) or "Unknown File"
-            display_filename = filename[:40] + "..." if len(filename) > 40 else filename
-            
             filename_label = ctk.CTkLabel(
                 top_frame, 
                 text=display_filename,
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=self.FONT_11B,
                 anchor="w"
             )
             filename_label.pack(side="left", fill="x", expand=True, padx=(0, 5))
@@ -1736,75 +2068,20 @@ class DownloadManagerUI(ctk.CTk):
             btn_frame = ctk.CTkFrame(top_frame, fg_color="transparent")
             btn_frame.pack(side="right", padx=(5, 0))
             
-            # Status-specific individual buttons
-            if item.status == "Queued":
-                # Move up/down buttons
-                ctk.CTkButton(btn_frame, text="▲", width=25, height=20,
-                            command=lambda idx=index: self._move_up(idx),
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-                ctk.CTkButton(btn_frame, text="▼", width=25, height=20,
-                            command=lambda idx=index: self._move_down(idx),
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-                # Remove button
-                ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
-                            command=lambda idx=index: self._remove_from_queue(idx),
-                            fg_color="red", hover_color="darkred",
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-            
-            elif item.status == "Downloading":
-                # Individual pause button for this item
-                ctk.CTkButton(btn_frame, text="⏸", width=25, height=20,
-                            command=lambda idx=index: self._pause_single_download(idx),
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-                # Individual cancel button for this item
-                ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
-                            command=lambda idx=index: self._cancel_single_download(idx),
-                            fg_color="red", hover_color="darkred",
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-            
-            elif item.status == "Paused":
-                # Individual resume button for this item
-                ctk.CTkButton(btn_frame, text="▶", width=25, height=20,
-                            command=lambda idx=index: self._resume_single_download(idx),
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-                # Individual cancel button for this item
-                ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
-                            command=lambda idx=index: self._cancel_single_download(idx),
-                            fg_color="red", hover_color="darkred",
-                            font=ctk.CTkFont(size=9)).pack(side="left", padx=1)
-            
-            # Prevent button clicks from triggering frame selection
-            for btn in btn_frame.winfo_children():
-                btn.bind("<Button-1>", lambda e: "break")
+            # Checkbox and buttons depend on the status and are rebuilt when it changes
+            row = {'top_frame': top_frame, 'filename_label': filename_label,
+                   'btn_frame': btn_frame, 'selection_cb': None, 'selection_widget': None}
+            self._build_queue_item_controls(row, item)
             
             # Middle row: Status information
             middle_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
             middle_frame.pack(fill="x", pady=(0, 1))
             
-            status_colors = {
-                "Queued": "gray",
-                "Downloading": "#3B8ED0",
-                "Paused": "orange", 
-                "Completed": "green",
-                "Error": "red",
-                "Cancelled": "darkgray"
-            }
-            
-            status_text = f"{item.status}"
-            if item.status == "Downloading":
-                status_text += f" | {item.progress:.1f}% | {item.speed:.2f} MB/s"
-                if hasattr(item, 'file_size') and item.file_size > 0:
-                    size_mb = item.file_size / (1024 * 1024)
-                    status_text += f" | {size_mb:.1f} MB"
-            elif item.status == "Error" and hasattr(item, 'error_message'):
-                error_display = item.error_message[:40] + "..." if len(item.error_message) > 40 else item.error_message
-                status_text += f" | {error_display}"
-            
             status_label = ctk.CTkLabel(
                 middle_frame, 
                 text=status_text,
-                text_color=status_colors.get(item.status, "gray"),
-                font=ctk.CTkFont(size=10),
+                text_color=status_color,
+                font=self.FONT_10,
                 anchor="w"
             )
             status_label.pack(fill="x")
@@ -1814,16 +2091,10 @@ class DownloadManagerUI(ctk.CTk):
             bottom_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
             bottom_frame.pack(fill="x")
             
-            timestamp_info = f"Added: {item.added_time.strftime('%H:%M:%S')}"
-            if item.start_time:
-                timestamp_info += f" | Started: {item.start_time.strftime('%H:%M:%S')}"
-            if item.end_time and item.status == "Completed":
-                timestamp_info += f" | Finished: {item.end_time.strftime('%H:%M:%S')}"
-            
             time_label = ctk.CTkLabel(
                 bottom_frame,
                 text=timestamp_info,
-                font=ctk.CTkFont(size=9),
+                font=self.FONT_9,
                 text_color="lightgray",
                 anchor="w"
             )
@@ -1832,14 +2103,205 @@ class DownloadManagerUI(ctk.CTk):
             
             # Store references for later
             item.ui_frame = item_frame
-            # selection_checkbox is already set in the if/else blocks above
+            # selection_checkbox is set by _build_queue_item_controls
+            
+            row.update({
+                'item_frame': item_frame,
+                'status_label': status_label,
+                'time_label': time_label,
+                'filename_text': display_filename,
+                'status_text': status_text,
+                'status_color': status_color,
+                'time_text': timestamp_info,
+                'text_key': self._queue_item_key(item),
+            })
             
             # Apply visual selection state
-            if item.selected:
-                item_frame.configure(border_width=1, border_color="#3B8ED0")
+            self._apply_queue_item_selection(row, item)
+            return row
                 
         except Exception as e:
             print(f"Error creating queue item {index}: {e}")
+            return None
+
+    def _build_queue_item_controls(self, row, item):
+        """(Re)build a queue row's checkbox and action buttons for the item's current status"""
+        top_frame = row['top_frame']
+        btn_frame = row['btn_frame']
+        
+        if row['selection_widget'] is not None:
+            row['selection_widget'].destroy()
+        for btn in btn_frame.winfo_children():
+            btn.destroy()
+        
+        # ✅ SELECTION CHECKBOX
+        if item.status in ["Queued", "Downloading", "Paused"]:
+            selection_var = ctk.BooleanVar(value=item.selected)
+            
+            def toggle_selection():
+                item.selected = selection_var.get()
+                # Row styling is applied by the refresh
+                self._request_queue_refresh()
+        
+            selection_cb = ctk.CTkCheckBox(
+                top_frame, 
+                text="", 
+                variable=selection_var,
+                command=toggle_selection,
+                width=20
+            )
+            selection_cb.pack(side="left", padx=(0, 5), before=row['filename_label'])
+            selection_cb.bind("<Button-1>", lambda e: "break")  # Prevent frame click
+            item.selection_checkbox = selection_cb
+            row['selection_widget'] = selection_cb
+        else:
+            # For completed items, add a placeholder to align
+            placeholder = ctk.CTkLabel(top_frame, text="", width=20)
+            placeholder.pack(side="left", padx=(0, 5), before=row['filename_label'])
+            item.selection_checkbox = None  # No checkbox for completed items
+            selection_cb = None
+            row['selection_widget'] = placeholder
+        row['selection_cb'] = selection_cb
+        row['status'] = item.status
+        
+        # ✅ INDIVIDUAL ACTION BUTTONS
+        # Rows are reused across reorders, so buttons resolve their index at click time
+        on_action = self._on_row_action
+        
+        # Status-specific individual buttons
+        if item.status == "Queued":
+            # Move up/down buttons
+            ctk.CTkButton(btn_frame, text="▲", width=25, height=20,
+                        command=functools.partial(on_action, "up", item),
+                        font=self.FONT_9).pack(side="left", padx=1)
+            ctk.CTkButton(btn_frame, text="▼", width=25, height=20,
+                        command=functools.partial(on_action, "down", item),
+                        font=self.FONT_9).pack(side="left", padx=1)
+            # Remove button
+            ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
+                        command=functools.partial(on_action, "remove", item),
+                        fg_color="red", hover_color="darkred",
+                        font=self.FONT_9).pack(side="left", padx=1)
+        
+        elif item.status == "Downloading":
+            # Individual pause button for this item
+            ctk.CTkButton(btn_frame, text="⏸", width=25, height=20,
+                        command=functools.partial(on_action, "pause", item),
+                        font=self.FONT_9).pack(side="left", padx=1)
+            # Individual cancel button for this item
+            ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
+                        command=functools.partial(on_action, "cancel", item),
+                        fg_color="red", hover_color="darkred",
+                        font=self.FONT_9).pack(side="left", padx=1)
+        
+        elif item.status == "Paused":
+            # Individual resume button for this item
+            ctk.CTkButton(btn_frame, text="▶", width=25, height=20,
+                        command=functools.partial(on_action, "resume", item),
+                        font=self.FONT_9).pack(side="left", padx=1)
+            # Individual cancel button for this item
+            ctk.CTkButton(btn_frame, text="✕", width=25, height=20,
+                        command=functools.partial(on_action, "cancel", item),
+                        fg_color="red", hover_color="darkred",
+                        font=self.FONT_9).pack(side="left", padx=1)
+        
+        # Prevent button clicks from triggering frame selection
+        for btn in btn_frame.winfo_children():
+            btn.bind("<Button-1>", lambda e: "break")
+
+    # Row button action -> handler taking the item's current queue index
+    _ROW_ACTIONS = {
+        "up": "_move_up",
+        "down": "_move_down",
+        "remove": "_remove_from_queue",
+        "pause": "_pause_single_download",
+        "resume": "_resume_single_download",
+        "cancel": "_cancel_single_download",
+    }
+
+    def _on_row_action(self, action, item):
+        """Run a queue row button's action against the item's current position"""
+        try:
+            index = self.download_queue.index(item)
+        except ValueError:
+            return  # item left the queue before the click was handled
+        getattr(self, self._ROW_ACTIONS[action])(index)
+
+    @staticmethod
+    def _queue_item_key(item):
+        """Values a queue row's labels are built from, at the precision they are shown"""
+        return (item.filename, item.status, round(item.progress, 1), round(item.speed, 2),
+                item.file_size, item.error_message, item.start_time, item.end_time)
+
+    def _queue_item_texts(self, item):
+        """Build the filename, status, status color and timestamp strings for a queue row"""
+        filename = item.filename
+        display_filename = filename[:40] + "..." if len(filename) > 40 else filename
+        
+        status_text = f"{item.status}"
+        if item.status == "Downloading":
+            status_text += f" | {item.progress:.1f}% | {item.speed:.2f} MB/s"
+            if item.file_size > 0:
+                size_mb = item.file_size * BYTES_TO_MB
+                status_text += f" | {size_mb:.1f} MB"
+        elif item.status == "Error":
+            error_display = item.error_message[:40] + "..." if len(item.error_message) > 40 else item.error_message
+            status_text += f" | {error_display}"
+        
+        timestamp_info = f"Added: {_format_clock(item.added_time)}"
+        if item.start_time:
+            timestamp_info += f" | Started: {_format_clock(item.start_time)}"
+        if item.end_time and item.status == "Completed":
+            timestamp_info += f" | Finished: {_format_clock(item.end_time)}"
+        
+        return display_filename, status_text, STATUS_COLORS.get(item.status, "gray"), timestamp_info
+
+    def _update_queue_item(self, row, item):
+        """Reconfigure only the labels of an existing queue row whose text changed"""
+        if row['selected'] != item.selected:
+            self._apply_queue_item_selection(row, item)
+        
+        # Nothing the labels show has moved since the last refresh: skip the formatting
+        key = self._queue_item_key(item)
+        if key == row['text_key']:
+            return
+        row['text_key'] = key
+        
+        display_filename, status_text, status_color, timestamp_info = self._queue_item_texts(item)
+        
+        if row['filename_text'] != display_filename:
+            row['filename_label'].configure(text=display_filename)
+            row['filename_text'] = display_filename
+        
+        if row['status_text'] != status_text or row['status_color'] != status_color:
+            row['status_label'].configure(text=status_text, text_color=status_color)
+            row['status_text'] = status_text
+            row['status_color'] = status_color
+        
+        if row['time_text'] != timestamp_info:
+            row['time_label'].configure(text=timestamp_info)
+            row['time_text'] = timestamp_info
+
+    def _apply_queue_item_selection(self, row, item):
+        """Sync a queue row's checkbox and border with the item's selection state"""
+        row['selected'] = item.selected
+        if row['selection_cb'] is not None:
+            if item.selected:
+                row['selection_cb'].select()
+            else:
+                row['selection_cb'].deselect()
+        if item.selected:
+            row['item_frame'].configure(border_width=1, border_color="#3B8ED0")
+        else:
+            row['item_frame'].configure(border_width=0)
+
+    def _destroy_queue_row(self, item_id):
+        """Destroy the widgets of a queue row that is no longer needed"""
+        row = self.queue_item_widgets.pop(item_id, None)
+        if row is not None:
+            row['item_frame'].destroy()
+        if item_id in self._queue_row_order:
+            self._queue_row_order.remove(item_id)
 
     def _move_up(self, index):
         """Move item up in queue"""
@@ -1847,7 +2309,7 @@ class DownloadManagerUI(ctk.CTk):
             if index > 0 and index < len(self.download_queue):
                 self.download_queue[index], self.download_queue[index-1] = \
                     self.download_queue[index-1], self.download_queue[index]
-                self._update_queue_display()
+                self._request_queue_refresh()
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to move item up: {str(e)}")
 
@@ -1857,7 +2319,7 @@ class DownloadManagerUI(ctk.CTk):
             if index < len(self.download_queue) - 1:
                 self.download_queue[index], self.download_queue[index+1] = \
                     self.download_queue[index+1], self.download_queue[index]
-                self._update_queue_display()
+                self._request_queue_refresh()
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to move item down: {str(e)}")
 
@@ -1869,34 +2331,44 @@ class DownloadManagerUI(ctk.CTk):
                 
                 # ✅ Record cancellation for queued items that are removed
                 if item.status == "Queued":
-                    self.history_manager.add_record(
+                    self._queue_history_record(
                         url=item.url,
-                        filename=item.filename or os.path.basename(item.url),
+                        filename=item.filename,
                         file_size=0,
                         status="Cancelled", 
                         speed=0,
                         error_msg="Removed from queue before download"
                     )
                 
-                # If removing current download, cancel it first
-                if self.current_download == self.download_queue[index]:
-                    self.cancel_current_download(confirm=False)
+                # If removing an active download, stop it first
+                if item in self.active_downloads:
+                    item.status = "Cancelled"
+                    if item.downloader:
+                        item.downloader.cancel()
+
+                # Leave a tombstone so any stale _queued entry is skipped
+                if item.status == "Queued":
+                    item.status = "Cancelled"
                 
+                self._completed_ids.discard(item.item_id)
                 del self.download_queue[index]
-                self._update_queue_display()
+                self._prune_queued()
+                self._request_queue_refresh()
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to remove item: {str(e)}")
 
     def clear_completed(self):
         """Remove completed downloads from queue"""
         try:
-            initial_count = len(self.download_queue)
-            self.download_queue = [item for item in self.download_queue 
-                                if item.status not in ["Completed", "Cancelled", "Error"]]
-            removed_count = initial_count - len(self.download_queue)
-            
+            completed_ids = self._completed_ids
+            removed_count = len(completed_ids)
             if removed_count > 0:
-                self._update_queue_display()
+                # Slice assignment keeps the same list object for anyone holding it
+                self.download_queue[:] = [item for item in self.download_queue 
+                                          if item.item_id not in completed_ids]
+                completed_ids.clear()
+                self._prune_queued()
+                self._request_queue_refresh()
                 messagebox.showinfo("Queue Cleared", f"Removed {removed_count} completed items from queue")
             else:
                 messagebox.showinfo("Queue Status", "No completed items to remove")
@@ -1906,7 +2378,7 @@ class DownloadManagerUI(ctk.CTk):
     def clear_all_queue(self):
         """Clear all items from queue"""
         try:
-            if self.current_download and self.current_download.status == "Downloading":
+            if any(item.status == "Downloading" for item in self.active_downloads):
                 messagebox.showwarning("Warning", "Cannot clear queue while download is in progress")
                 return
             
@@ -1915,8 +2387,25 @@ class DownloadManagerUI(ctk.CTk):
                 return
             
             if messagebox.askyesno("Confirm", f"Clear all {len(self.download_queue)} downloads from queue?"):
+                # Paused downloads still hold a pool worker; stop them so their slots are freed
+                for item in self.download_queue:
+                    if item.downloader and item.status != "Cancelled":
+                        item.status = "Cancelled"
+                        self._queue_history_record(
+                            url=item.url,
+                            filename=item.filename,
+                            file_size=0,
+                            status="Cancelled",
+                            speed=0,
+                            error_msg="Removed by Clear All"
+                        )
+                    if item.downloader:
+                        item.downloader.cancel()
                 self.download_queue.clear()
-                self._update_queue_display()
+                self._queued.clear()
+                self._completed_ids.clear()
+                self.pending_downloads.clear()
+                self._request_queue_refresh()
                 messagebox.showinfo("Queue Cleared", "All items removed from queue")
         except Exception as e:
             messagebox.showerror("Queue Error", f"Failed to clear queue: {str(e)}")
@@ -1934,14 +2423,9 @@ class DownloadManagerUI(ctk.CTk):
                 print(f"⚠ Item {item.filename} is already completed")
                 return
                 
-            # Set this as active download ONLY for tracking purposes
-            # But allow multiple items to be "current" by having a list
-            if not hasattr(self, 'active_downloads'):
-                self.active_downloads = []
-            
-            # Add to active downloads if not already there
-            if item not in self.active_downloads:
-                self.active_downloads.append(item)
+            self.active_downloads.add(item)
+            if item in self.pending_downloads:
+                self.pending_downloads.remove(item)
             
             item.status = "Downloading"
             item.start_time = datetime.now()
@@ -1958,7 +2442,7 @@ class DownloadManagerUI(ctk.CTk):
             self.status_label.configure(text=status_text, text_color="white")
             
             # Update current file label for this specific item
-            short_name = item.filename or os.path.basename(item.url) or "Unknown"
+            short_name = item.filename
             if len(short_name) > 30:
                 short_name = short_name[:27] + "..."
             self.current_file_label.configure(text=f"Started: {short_name}")
@@ -1967,10 +2451,10 @@ class DownloadManagerUI(ctk.CTk):
             self._update_main_button_states()
             
             # Update the queue display
-            self._update_queue_display()
+            self._request_queue_refresh()
             
-            # Start download in background thread
-            threading.Thread(target=self._run_download_item, args=(item,), daemon=True).start()
+            # Run the download on the persistent download pool
+            self._download_executor.submit(self._run_download_item, item)
             
             print(f"🚀 Started download: {item.filename} (Active downloads: {len(self.active_downloads)})")
             
@@ -1980,32 +2464,31 @@ class DownloadManagerUI(ctk.CTk):
     def _run_download_item(self, item):
         """Run the download for a queue item with proper error handling"""
         download_successful = False
+        cancelled = False
         error_message = ""
         
         try:
             num_threads = 8  # Default thread count
 
+            # Per-thread progress slots read directly by update_thread_display
+            progress = AggregatingProgress(item, on_change=self._request_thread_display)
+
             # Create downloader
             downloader = FastDownloader(
                 item.url,
                 num_threads=num_threads,
-                progress_callback=lambda idx, speed, percent: self.progress_queue.put((idx, speed, percent)),
+                progress_callback=progress.update,
                 download_path=item.download_path,
             )
-        
-        # ... rest of your existing code ...
-            
+
             item.downloader = downloader
-            self.downloader = downloader
-            
-            # Initialize progress arrays
-            num_threads = downloader.num_threads
-            self.thread_percents = [0] * num_threads
-            self.thread_speed = [0] * num_threads
-            
-            # Update UI with thread count
-            self.after(0, lambda: self._update_thread_labels_visibility(num_threads))
-            self.after(0, lambda: self._ensure_thread_labels(downloader.num_threads))
+            if self._closing or item.status == "Cancelled":
+                # Cancelled (or the window closed) while the HEAD request was in flight
+                downloader.cancel()
+
+            # Register this item's progress slots; the thread panel follows the oldest active item
+            progress.resize(downloader.num_threads)
+            self.item_progress[item.item_id] = progress
             # Start download
             downloader.start()
 
@@ -2069,6 +2552,10 @@ class DownloadManagerUI(ctk.CTk):
                     
                     error_message = f"Download completed but file not found. Expected at: {expected_path}"
         
+        except DownloadCancelled:
+            cancelled = True
+            print(f"Download cancelled: {item.filename}")
+
         except Exception as e:
             error_message = str(e)
             #✅ Better error message for connection issues
@@ -2083,20 +2570,37 @@ class DownloadManagerUI(ctk.CTk):
             print(f"Download error: {error_message}")
 
         finally:
-            if download_successful:
+            if item.status == "Cancelled":
+                # The cancel path already updated the item and recorded history
+                pass
+            elif cancelled:
+                # Stopped without going through a cancel handler
+                item.status = "Cancelled"
+                item.progress = 0
+                item.end_time = datetime.now()
+                self._queue_history_record(
+                    url=item.url,
+                    filename=item.filename,
+                    file_size=0,
+                    status="Cancelled",
+                    speed=0,
+                    error_msg="Download cancelled"
+                )
+            elif download_successful:
                 # Download completed successfully
                 item.status = "Completed"
                 item.progress = 100
                 item.end_time = datetime.now()
-                self.after(0, lambda: self._categorize_file(item))
+                if not self._closing:
+                    self.after(0, lambda: self._categorize_file(item))
                 
                 # Record successful completion
-                self.history_manager.add_record(
+                self._queue_history_record(
                     url=item.url,
-                    filename=item.filename or os.path.basename(item.url),
+                    filename=item.filename,
                     file_size=item.file_size,
                     status="Completed",
-                    speed=sum(self.thread_speed) if self.thread_speed else 0
+                    speed=item.speed
                 )
                 print(f"✅ Download completed successfully: {item.filename}")
             else:
@@ -2104,14 +2608,11 @@ class DownloadManagerUI(ctk.CTk):
                 item.error_message = error_message
                 item.progress = 0
                 item.end_time = datetime.now()
-
-                # Start next download if any
-                self._check_and_start_next_download()
                 
                 # Record error
-                self.history_manager.add_record(
+                self._queue_history_record(
                     url=item.url,
-                    filename=item.filename or os.path.basename(item.url),
+                    filename=item.filename,
                     file_size=0,
                     status="Error",
                     speed=0,
@@ -2119,8 +2620,33 @@ class DownloadManagerUI(ctk.CTk):
                 )
                 print(f"Download error: {error_message}")
             
-                # Move to next item or finish
-            self.after(0, self._download_item_finished)
+            # Free the slot and start whatever is waiting; the window may already be gone
+            if not self._closing:
+                self.after(0, lambda: self._download_item_finished(item))
+
+    def _queue_history_record(self, **record):
+        """Hand a history record to the writer thread without blocking on disk I/O"""
+        try:
+            self._history_queue.put_nowait(record)
+        except queue.Full:
+            # Writer is far behind - drop the oldest pending record to make room
+            try:
+                dropped = self._history_queue.get_nowait()
+                print(f"⚠ History queue full, dropped record: {dropped.get('filename')} ({dropped.get('status')})")
+                self._history_queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                print(f"⚠ History queue full, dropped record: {record.get('filename')} ({record.get('status')})")
+
+    def _history_writer(self):
+        """Persist queued history records in order on a background thread; None stops it"""
+        while True:
+            record = self._history_queue.get()
+            if record is None:
+                return
+            try:
+                self.history_manager.add_record(**record)
+            except Exception as e:
+                print(f"History write error: {e}")
 
     def generate_unique_filename(self, filename):
         """Generate a unique filename by appending numbers if duplicate exists"""
@@ -2191,33 +2717,56 @@ class DownloadManagerUI(ctk.CTk):
             tab_view = ctk.CTkTabview(history_window)
             tab_view.pack(fill="both", expand=True, padx=10, pady=10)
             
-            # Statistics Tab
+            # Statistics and Recent Downloads tabs are filled in once the data is loaded
             stats_tab = tab_view.add("Statistics")
-            self._create_stats_tab(stats_tab)
-            
-            # Recent Downloads Tab
             history_tab = tab_view.add("Recent Downloads")
-            self._create_history_tab(history_tab)
+            placeholders = [ctk.CTkLabel(tab, text="Loading...", text_color="gray")
+                            for tab in (stats_tab, history_tab)]
+            for label in placeholders:
+                label.pack(pady=20)
             
             # Export Tab
             export_tab = tab_view.add("Export")
             self._create_export_tab(export_tab)
+
+            def populate(stats, recent_downloads):
+                if not history_window.winfo_exists():
+                    return
+                for label in placeholders:
+                    label.destroy()
+                self._create_stats_tab(stats_tab, stats)
+                self._create_history_tab(history_tab, recent_downloads)
+
+            # Reopening with unchanged history reuses the last loaded data
+            snapshot = self._history_snapshot
+            if snapshot is not None and snapshot[0] == self.history_manager.version:
+                populate(snapshot[1], snapshot[2])
+                return
+
+            def load_worker():
+                try:
+                    version = self.history_manager.version
+                    stats = self.history_manager.get_statistics_cached(days=30)
+                    recent_downloads = self.history_manager.get_recent_downloads(limit=100)
+                    self._history_snapshot = (version, stats, recent_downloads)
+                    self.after(0, lambda: populate(stats, recent_downloads))
+                except Exception as e:
+                    print(f"History load error: {e}")
+
+            threading.Thread(target=load_worker, daemon=True).start()
             
         except Exception as e:
             messagebox.showerror("History Error", f"Failed to open history: {str(e)}")
 
-    def _create_stats_tab(self, parent):
+    def _create_stats_tab(self, parent, stats):
         """Create statistics tab content"""
-        # Get statistics
-        stats = self.history_manager.get_statistics(days=30)
-        
         # Statistics frame
         stats_frame = ctk.CTkScrollableFrame(parent)
         stats_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Overall statistics
         ctk.CTkLabel(stats_frame, text="Last 30 Days Statistics", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(anchor="w", pady=10)
+                    font=self.FONT_18B).pack(anchor="w", pady=10)
         
         # Stats grid
         stats_grid = ctk.CTkFrame(stats_frame)
@@ -2239,70 +2788,118 @@ class DownloadManagerUI(ctk.CTk):
             stat_frame = ctk.CTkFrame(stats_grid)
             stat_frame.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
             
-            ctk.CTkLabel(stat_frame, text=label, font=ctk.CTkFont(size=12), 
+            ctk.CTkLabel(stat_frame, text=label, font=self.FONT_12, 
                         text_color="gray").pack(anchor="w")
-            ctk.CTkLabel(stat_frame, text=value, font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w")
+            ctk.CTkLabel(stat_frame, text=value, font=self.FONT_16B).pack(anchor="w")
 
-    def _create_history_tab(self, parent):
+    def _create_history_tab(self, parent, recent_downloads):
         """Create recent downloads history tab"""
-        # Get recent downloads
-        recent_downloads = self.history_manager.get_recent_downloads(limit=100)
-        
-        # History frame
-        history_frame = ctk.CTkScrollableFrame(parent)
-        history_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
         if not recent_downloads:
-            ctk.CTkLabel(history_frame, text="No download history yet", 
+            ctk.CTkLabel(parent, text="No download history yet", 
                         text_color="gray").pack(pady=20)
             return
-        
-        for record in recent_downloads:
-            self._create_history_item(history_frame, record)
 
-    def _create_history_item(self, parent, record):
-        """Create a single history item"""
+        # History frame: a fixed pool of rows re-filled as the list scrolls
+        history_frame = ctk.CTkFrame(parent)
+        history_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        total = len(recent_downloads)
+        rows_frame = ctk.CTkFrame(history_frame, fg_color="transparent")
+        rows_frame.pack(side="left", fill="both", expand=True)
+        rows_frame.grid_columnconfigure(0, weight=1)
+        pool = [self._create_history_item(rows_frame, i)
+                for i in range(min(HISTORY_VISIBLE_ROWS, total))]
+        state = {'first': 0}
+
+        def render(first):
+            first = max(0, min(first, total - len(pool)))
+            state['first'] = first
+            for row, record in zip(pool, recent_downloads[first:first + len(pool)]):
+                self._fill_history_item(row, record)
+            scrollbar.set(first / total, (first + len(pool)) / total)
+
+        def on_scrollbar(*args):
+            if args[0] == "moveto":
+                render(int(float(args[1]) * total))
+            elif args[0] == "scroll":
+                step = len(pool) if args[2] == "pages" else 1
+                render(state['first'] + int(args[1]) * step)
+
+        def on_wheel(event):
+            if getattr(event, 'num', None) == 4 or event.delta > 0:
+                render(state['first'] - 1)
+            else:
+                render(state['first'] + 1)
+
+        scrollbar = ctk.CTkScrollbar(history_frame, command=on_scrollbar)
+        scrollbar.pack(side="right", fill="y")
+
+        # Wheel events go to the widget under the pointer, so bind every pooled widget
+        for row in pool:
+            for widget in (row['frame'], row['name_label'], row['status_label'], row['time_label']):
+                widget.bind("<MouseWheel>", on_wheel)
+                widget.bind("<Button-4>", on_wheel)
+                widget.bind("<Button-5>", on_wheel)
+
+        render(0)
+
+    def _create_history_item(self, parent, index):
+        """Create an empty history row and return its widgets for reuse"""
+        # One frame per row; the labels are gridded straight into it
         item_frame = ctk.CTkFrame(parent)
-        item_frame.pack(fill="x", pady=2, padx=5)
+        item_frame.grid(row=index, column=0, sticky="ew", pady=2, padx=5)
+        item_frame.grid_columnconfigure(0, weight=1)
         
-        # Status color
-        status_colors = {
-            "Completed": "green",
-            "Error": "red",
-            "Started": "blue",
-            "Cancelled": "gray"
-        }
+        # Filename and status
+        name_label = ctk.CTkLabel(item_frame, text="", 
+                    font=self.FONT_12B,
+                    anchor="w")
+        name_label.grid(row=0, column=0, sticky="ew", padx=5, pady=(3, 0))
         
-        # Left side - Basic info
-        left_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True, padx=5, pady=3)
+        status_label = ctk.CTkLabel(item_frame, text="",
+                    font=self.FONT_10,
+                    anchor="w")
+        status_label.grid(row=1, column=0, sticky="ew", padx=5)
         
-        # Filename and status
+        # Timestamp
+        time_label = ctk.CTkLabel(item_frame, text="",
+                    font=self.FONT_9,
+                    text_color="lightgray",
+                    anchor="w")
+        time_label.grid(row=2, column=0, sticky="ew", padx=5, pady=(0, 3))
+
+        return {
+            'frame': item_frame,
+            'name_label': name_label,
+            'status_label': status_label,
+            'time_label': time_label,
+            'color': None,
+        }
+
+    def _fill_history_item(self, row, record):
+        """Show a history record in a pooled row"""
         filename = record.get('filename', 'Unknown')
         display_name = filename[:50] + "..." if len(filename) > 50 else filename
         
-        ctk.CTkLabel(left_frame, text=display_name, 
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    anchor="w").pack(fill="x")
-        
-        status_text = f"Status: {record['status']}"
-        if record.get('file_size'):
-            size_mb = record['file_size'] / (1024 * 1024)
-            status_text += f" | Size: {size_mb:.1f} MB"
-        if record.get('download_speed'):
-            status_text += f" | Speed: {record['download_speed']:.2f} MB/s"
-        
-        ctk.CTkLabel(left_frame, text=status_text,
-                    text_color=status_colors.get(record['status'], "gray"),
-                    font=ctk.CTkFont(size=10),
-                    anchor="w").pack(fill="x")
+        size = record.get('file_size') or 0
+        speed = record.get('download_speed') or 0
+        status_text = (
+            f"Status: {record['status']}"
+            + (f" | Size: {size * BYTES_TO_MB:.1f} MB" if size else "")
+            + (f" | Speed: {speed:.2f} MB/s" if speed else "")
+        )
         
-        # Timestamp
-        timestamp = datetime.fromisoformat(record['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
-        ctk.CTkLabel(left_frame, text=timestamp,
-                    font=ctk.CTkFont(size=9),
-                    text_color="lightgray",
-                    anchor="w").pack(fill="x")
+        timestamp = _format_history_timestamp(record['timestamp'])
+
+        row['name_label'].configure(text=display_name)
+        color = HISTORY_STATUS_COLORS.get(record['status'], "gray")
+        if color != row['color']:
+            # Recoloring is a separate redraw, so only do it when the status changes
+            row['color'] = color
+            row['status_label'].configure(text=status_text, text_color=color)
+        else:
+            row['status_label'].configure(text=status_text)
+        row['time_label'].configure(text=timestamp)
 
     def _create_export_tab(self, parent):
         """Create export tab content"""
@@ -2310,7 +2907,7 @@ class DownloadManagerUI(ctk.CTk):
         export_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         ctk.CTkLabel(export_frame, text="Export Options",
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=self.FONT_16B).pack(pady=10)
         
         # Export buttons
         ctk.CTkButton(export_frame, text="Export to CSV", 
@@ -2330,9 +2927,15 @@ class DownloadManagerUI(ctk.CTk):
         # History info
         total_records = len(self.history_manager.history)
         ctk.CTkLabel(export_frame, text=f"Total records: {total_records}",
-                    font=ctk.CTkFont(size=12),
+                    font=self.FONT_12,
                     text_color="gray").pack(pady=10)
 
+        # Export progress, filled in by export events
+        self.export_progress_label = ctk.CTkLabel(export_frame, text="",
+                    font=self.FONT_12,
+                    text_color="gray")
+        self.export_progress_label.pack(pady=5)
+
     def export_history_csv(self):
         """Export history to CSV"""
         try:
@@ -2341,13 +2944,68 @@ class DownloadManagerUI(ctk.CTk):
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
             if filename:
-                if self.history_manager.export_to_csv(filename):
-                    messagebox.showinfo("Export Successful", f"History exported to {filename}")
-                else:
-                    messagebox.showerror("Export Failed", "Failed to export history")
+                # Write the file on a worker; results come back through the UI event queue
+                threading.Thread(target=self._do_export, args=(filename,), daemon=True).start()
         except Exception as e:
             messagebox.showerror("Export Error", f"Export failed: {str(e)}")
 
+    def _do_export(self, filename):
+        """Write the CSV export - runs on a worker thread, never touches widgets"""
+        try:
+            ok = self.history_manager.export_to_csv(
+                filename,
+                progress_callback=lambda done, total: self._post_ui_event("export_progress", done, total)
+            )
+            self._post_ui_event("export_done", ok, filename)
+        except Exception as e:
+            self._post_ui_event("export_error", str(e))
+
+    def _post_ui_event(self, tag, *args):
+        """Queue a tagged event for the Tk thread; safe to call from any thread"""
+        self._ui_events.append((tag, args))
+        if not self._ui_events_pending:
+            self._ui_events_pending = True
+            try:
+                self.after(0, self._drain_ui_events)
+            except RuntimeError:
+                # Main loop is already gone during shutdown
+                pass
+
+    def _drain_ui_events(self):
+        """Dispatch every queued UI event on the Tk thread"""
+        self._ui_events_pending = False
+        handlers = {
+            "export_progress": self._on_export_progress,
+            "export_done": self._on_export_done,
+            "export_error": self._on_export_error,
+        }
+        # Drain only what is queued now, at most one batch per Tk callback
+        for _ in range(min(len(self._ui_events), UI_EVENT_BATCH)):
+            tag, args = self._ui_events.popleft()
+            try:
+                handlers[tag](*args)
+            except Exception as e:
+                print(f"UI event error ({tag}): {e}")
+
+        # Backlogged: let Tk handle input and redraws, then catch up right away
+        if self._ui_events and not self._ui_events_pending:
+            self._ui_events_pending = True
+            self.after(0, self._drain_ui_events)
+
+    def _on_export_progress(self, done, total):
+        label = getattr(self, 'export_progress_label', None)
+        if label is not None and label.winfo_exists():
+            label.configure(text=f"Exported {done}/{total} records")
+
+    def _on_export_done(self, ok, filename):
+        if ok:
+            messagebox.showinfo("Export Successful", f"History exported to {filename}")
+        else:
+            messagebox.showerror("Export Failed", "Failed to export history")
+
+    def _on_export_error(self, error):
+        messagebox.showerror("Export Error", f"Export failed: {error}")
+
     def clear_history(self):
         """Clear download history with file cleanup options"""
         try:
@@ -2395,20 +3053,30 @@ class DownloadManagerUI(ctk.CTk):
             print(f"File deletion error: {e}")
             return 0   
 
-    def _download_item_finished(self):
+    def _download_item_finished(self, item=None):
         """Handle completion of a download item (success or error)"""
         try:
-            # Clear thread display
-            self.thread_percents = []
-            self.thread_speed = []
-            
-            # Hide all thread labels
-            for label in self.thread_labels:
-                label.pack_forget()
-            
-            # Clear current download references
-            self.current_download = None
-            self.downloader = None
+            if item is not None:
+                self.item_progress.pop(item.item_id, None)
+                self.active_downloads.discard(item)
+                # Cancelled items were indexed by their cancel handler (and may since be removed)
+                if item.status in ("Completed", "Error"):
+                    self._completed_ids.add(item.item_id)
+
+            # Clear thread display once nothing is left to show
+            if not self.item_progress:
+                self.thread_percents = array.array('d')
+                self.thread_speed = array.array('d')
+                self._ensure_thread_labels(0)   # hides all thread labels
+
+                # Throttled redraws may have missed the last values; settle the overall widgets
+                finished = item is not None and item.status == "Completed"
+                self._last_overall_text = _format_overall(1000 if finished else 0)
+                self._last_progress = 1.0 if finished else 0.0
+                self._last_speed_text = _format_speed(0)
+                self.overall_label.configure(text=self._last_overall_text)
+                self.overall_progress.set(self._last_progress)
+                self.overall_speed_label.configure(text=self._last_speed_text)
             
             # Update status based on remaining active downloads
             active_downloads = [item for item in self.download_queue 
@@ -2436,17 +3104,15 @@ class DownloadManagerUI(ctk.CTk):
                 # No active downloads
                 self.status_label.configure(text="Idle", text_color="green")
                 self.current_file_label.configure(text="Current: None")
-                
-                # Check if we should auto-start next download
-                self._check_and_start_next_download()
+            
+            # Fill the freed slot with the next waiting or auto-started item
+            self._check_and_start_next_download()
             
             # Update button states
             self._update_main_button_states()
             
             # Update queue display (this will refresh checkboxes, etc.)
-            self._update_queue_display()
-            
-            self._ensure_thread_labels(0)   # hides all thread labels
+            self._request_queue_refresh()
 
         except Exception as e:
             print(f"Download finished error: {e}")
@@ -2454,44 +3120,39 @@ class DownloadManagerUI(ctk.CTk):
     def _start_next_download(self):
         """Start the next download in queue"""
         try:
-            for item in self.download_queue:
+            while self._queued:
+                item = self._queued.popleft()
+                # Entries whose item was started, cancelled or removed meanwhile are stale
                 if item.status == "Queued":
                     self._start_download_item(item)
                     return
         except Exception as e:
             print(f"Next download error: {e}")
 
-    def _update_thread_labels_visibility(self, num_threads):
-        """Show/hide thread labels based on actual thread count"""
-        try:
-            for i, label in enumerate(self.thread_labels):
-                if i < num_threads:
-                    label.pack(anchor="w", pady=1)
-                else:
-                    label.pack_forget()
-        except Exception as e:
-            print(f"Thread label update error: {e}")
-
     def _ensure_thread_labels(self, needed):
-        """Make sure we have at least 'needed' thread labels, creating them on demand."""
+        """Show exactly 'needed' thread labels, creating extra ones on demand."""
         # Create new labels if we don't have enough
         while len(self.thread_labels) < needed:
             lbl = ctk.CTkLabel(
                 self.thread_scrollable_frame,
                 text="",
                 text_color="gray",
-                font=ctk.CTkFont(size=11)
+                font=self.FONT_11
             )
-            lbl.pack(anchor="w", pady=1)
+            # Register the grid slot but start hidden; the loop below decides what is shown
+            lbl.grid(row=len(self.thread_labels), column=0, sticky="w", pady=1)
+            lbl.grid_remove()
             self.thread_labels.append(lbl)
+            self._last_shown.append((-1.0, -1.0))
+            self._thread_prefix.append(f"Thread {len(self.thread_labels)}: ")
         
-        # Show the first 'needed' labels, hide any extras
-        for i, lbl in enumerate(self.thread_labels):
-            if i < needed:
-                # Make sure it's visible (pack it again if hidden)
-                lbl.pack(anchor="w", pady=1)
-            else:
-                lbl.pack_forget()
+        # Only touch the rows whose visibility actually changes
+        visible = self._visible_thread_labels
+        for i in range(visible, needed):
+            self.thread_labels[i].grid()
+        for i in range(needed, visible):
+            self.thread_labels[i].grid_remove()
+        self._visible_thread_labels = needed
 
     def start_download(self):
 
@@ -2503,27 +3164,39 @@ class DownloadManagerUI(ctk.CTk):
             
             if selected_queued:
                 print(f"🚀 Starting {len(selected_queued)} selected queued item(s)")
-                # Start each selected queued item
+                # Start selected items up to the concurrency limit; the rest wait for a slot
+                started = 0
                 for item in selected_queued:
-                    self._start_download_item(item)
+                    if self._free_download_slots() > 0:
+                        self._start_download_item(item)
+                        started += 1
+                    elif item not in self.pending_downloads:
+                        self.pending_downloads.append(item)
                 
                 # Clear selection after starting
                 for item in selected_queued:
                     item.selected = False
                     
-                self._update_queue_display()
-                self.status_label.configure(
-                    text=f"Started {len(selected_queued)} selected item(s)", 
-                    text_color="white"
-                )
+                self._request_queue_refresh()
+                status_text = f"Started {started} selected item(s)"
+                if started < len(selected_queued):
+                    status_text += f", {len(selected_queued) - started} waiting"
+                self.status_label.configure(text=status_text, text_color="white")
             else:
-                # If nothing selected, find first queued item
-                queued_items = [item for item in self.download_queue if item.status == "Queued"]
+                # If nothing selected, fill the free slots from the front of the queue;
+                # the scan stops as soon as enough queued items are found
+                free = self._free_download_slots()
+                queued_items = list(itertools.islice(
+                    (item for item in self.download_queue if item.status == "Queued"),
+                    max(free, 1)))
                 if queued_items:
-                    print(f"🚀 Starting first queued item: {queued_items[0].filename}") 
-                    self._start_download_item(queued_items[0])
+                    to_start = queued_items[:free]
+                    for item in to_start:
+                        print(f"🚀 Starting queued item: {item.filename}")
+                        self._start_download_item(item)
                     self.status_label.configure(
-                        text=f"Started: {queued_items[0].filename}", 
+                        text=f"Started {len(to_start)} queued item(s)" if to_start
+                             else f"All {self.max_concurrent_downloads} download slots are busy",
                         text_color="white"
                     )
                 else:
@@ -2542,20 +3215,14 @@ class DownloadManagerUI(ctk.CTk):
                 paused_count = 0
                 for item in selected_items:
                     if item.status == "Downloading" and item.downloader:
-                        # Ensure the downloader has a paused attribute
-                        if not hasattr(item.downloader, 'paused'):
-                            print(f"⚠ Downloader missing paused attribute: {item.filename}")
-                            # Add the attribute if missing
-                            item.downloader.paused = False
-                        
+                        # Each item owns its downloader; pause() sets its paused flag
                         item.downloader.pause()
-                        item.downloader.paused = True  # Explicitly set to True
                         item.status = "Paused"
                         paused_count += 1
                         print(f"⏸ Paused: {item.filename}")
                 
                 if paused_count > 0:
-                    self._update_queue_display()
+                    self._request_queue_refresh()
                     self.status_label.configure(
                         text=f"Paused {paused_count} selected item(s)", 
                         text_color="orange"
@@ -2570,12 +3237,9 @@ class DownloadManagerUI(ctk.CTk):
                 if active_downloads:
                     for item in active_downloads:
                         if item.downloader:
-                            if not hasattr(item.downloader, 'paused'):
-                                item.downloader.paused = False
                             item.downloader.pause()
-                            item.downloader.paused = True
                             item.status = "Paused"
-                    self._update_queue_display()
+                    self._request_queue_refresh()
                     self.status_label.configure(
                         text=f"Paused {len(active_downloads)} active download(s)", 
                         text_color="orange"
@@ -2605,44 +3269,32 @@ class DownloadManagerUI(ctk.CTk):
                 for item in selected_items:
                     if item.status in ["Queued", "Downloading", "Paused"]:
                         # Stop the downloader if it exists
+                        item.status = "Cancelled"
                         if item.downloader:
-                            item.downloader.paused = True
+                            item.downloader.cancel()
                         
                         # Record in history
-                        self.history_manager.add_record(
+                        self._queue_history_record(
                             url=item.url,
-                            filename=item.filename or os.path.basename(item.url),
+                            filename=item.filename,
                             file_size=0,
                             status="Cancelled",
                             speed=0,
                             error_msg="Cancelled by user (selected)"
                         )
                         
-                        item.status = "Cancelled"
                         item.progress = 0
-
-                        # Remove from active downloads if present
-                        if hasattr(self, 'active_downloads') and item in self.active_downloads:
-                            self.active_downloads.remove(item)
-                            print(f"Removed {item.filename} from active downloads")
+                        self._completed_ids.add(item.item_id)
 
                         cancelled_count += 1
                         print(f"✕ Cancelled: {item.filename}")
                 
                 if cancelled_count > 0:
-                    self._update_queue_display()
+                    self._request_queue_refresh()
                     self.status_label.configure(
                         text=f"Cancelled {cancelled_count} selected item(s)", 
                         text_color="red"
                     )
-                    self._check_and_start_next_download()
-
-                    if not any(item.status == "Downloading" for item in self.download_queue):
-                        auto_start = self._load_setting('auto_start', False)
-                        if auto_start:
-                            queued_items = [item for item in self.download_queue if item.status == "Queued"]
-                            if queued_items:
-                                self.after(1000, lambda: self._start_download_item(queued_items[0]))
                 else:
                     messagebox.showinfo("Info", "No cancellable items selected")
                     
@@ -2658,44 +3310,31 @@ class DownloadManagerUI(ctk.CTk):
                     
                     cancelled_count = 0
                     for item in active_items:
+                        item.status = "Cancelled"
                         if item.downloader:
-                            item.downloader.paused = True
+                            item.downloader.cancel()
                         
-                        self.history_manager.add_record(
+                        self._queue_history_record(
                             url=item.url,
-                            filename=item.filename or os.path.basename(item.url),
+                            filename=item.filename,
                             file_size=0,
                             status="Cancelled",
                             speed=0,
                             error_msg="Download cancelled by user"
                         )
                         
-                        item.status = "Cancelled"
                         item.progress = 0
-
-                        # Remove from active downloads if present
-                        if hasattr(self, 'active_downloads') and item in self.active_downloads:
-                            self.active_downloads.remove(item)
-                            print(f"Removed {item.filename} from active downloads")
+                        self._completed_ids.add(item.item_id)
 
                         cancelled_count += 1
                         print(f"✕ Cancelled: {item.filename}")
                     
-                    self._update_queue_display()
+                    self._request_queue_refresh()
                     self.status_label.configure(
                         text=f"Cancelled {len(active_items)} active download(s)", 
                         text_color="red"
                     )
 
-                    self._check_and_start_next_download()
-
-                    if not any(item.status == "Downloading" for item in self.download_queue):
-                        auto_start = self._load_setting('auto_start', False)
-                        if auto_start:
-                            queued_items = [item for item in self.download_queue if item.status == "Queued"]
-                            if queued_items:
-                                self.after(1000, lambda: self._start_download_item(queued_items[0]))
-
                 else:
                     messagebox.showinfo("Info", "No active downloads to cancel")
 
@@ -2704,8 +3343,51 @@ class DownloadManagerUI(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Cancel Error", f"Failed to cancel download: {str(e)}")
 
+    def _request_thread_display(self):
+        """Coalesce progress events into one update_thread_display call on the Tk thread"""
+        if self._thread_ui_pending or self._closing:
+            return
+        self._thread_ui_pending = True
+        # Progress from several downloads shares one redraw budget
+        delay = self._last_display_ts + 1.0 / self.max_redraw_hz - time.monotonic()
+        try:
+            self._thread_ui_handle = self.after(max(0, int(delay * 1000)), self.update_thread_display)
+        except RuntimeError:
+            # Main loop is already gone during shutdown
+            self._thread_ui_pending = False
+
     def update_thread_display(self):
         """Update the UI with current progress and speeds"""
+        self._thread_ui_pending = False
+        self._last_display_ts = time.monotonic()
+
+        # Nothing to redraw while every active item is paused or none is running
+        if not any(item.status == "Downloading" for item in self.active_downloads):
+            return
+
+        # Read the latest per-thread values straight from each item's progress slots
+        # Overall totals are accumulated in the same pass, without temporary lists
+        displayed = None
+        total_percent = 0.0
+        total_speed = 0.0
+        item_count = 0
+        for progress in list(self.item_progress.values()):
+            item = progress.item
+            item_count += 1
+            if progress.percents:
+                item.progress = sum(progress.percents) / len(progress.percents)
+                item.speed = sum(progress.speeds)
+                if displayed is None:
+                    displayed = progress
+            total_percent += item.progress
+            total_speed += item.speed
+
+        # The thread panel shows the oldest active item
+        if displayed is not None:
+            self.thread_speed = displayed.speeds
+            self.thread_percents = displayed.percents
+
+        # Only the widget writes can fail, when the window closes mid-update
         try:
             # Determine how many threads are active
             active_threads = len(self.thread_percents)
@@ -2713,67 +3395,45 @@ class DownloadManagerUI(ctk.CTk):
             # Ensure we have enough thread labels (creates them if needed)
             self._ensure_thread_labels(active_threads)
 
-            # Process queued progress updates
-            while not self.progress_queue.empty():
-                try:
-                    item = self.progress_queue.get_nowait()
-                    if isinstance(item, tuple) and len(item) == 3:
-                        idx, speed, percent = item
-                        
-                        # Ensure arrays are large enough
-                        while len(self.thread_percents) <= idx:
-                            self.thread_percents.append(0)
-                        while len(self.thread_speed) <= idx:
-                            self.thread_speed.append(0)
-                        
-                        # Update progress and speed
-                        self.thread_percents[idx] = percent
-                        self.thread_speed[idx] = speed
-                        
-                        # Update current download progress
-                        if self.current_download:
-                            self.current_download.progress = percent
-                            self.current_download.speed = speed
-                        
-                except queue.Empty:
-                    break
-
-            # Update all thread labels based on current arrays
-            for i in range(active_threads):
-                if i < len(self.thread_labels):
-                    speed = self.thread_speed[i] if i < len(self.thread_speed) else 0
-                    percent = self.thread_percents[i] if i < len(self.thread_percents) else 0
-                    bar_length = 15
-                    filled = int(percent / 100 * bar_length) if percent else 0
-                    bar = "█" * filled + "░" * (bar_length - filled)
-                    status = f"Thread {i+1}: {speed:5.2f} MB/s ({percent:5.1f}%) {bar}"
-                    self.thread_labels[i].configure(text=status)
-
-            # Update overall progress
-            if self.thread_percents:
-                valid_percents = [p for p in self.thread_percents if p is not None]
-                if valid_percents:
-                    overall_percent = sum(valid_percents) / len(valid_percents)
-                    self.overall_label.configure(text=f"Overall: {overall_percent:.1f}%")
-                    self.overall_progress.set(overall_percent / 100)
-
-            # Update overall speed
-            if self.thread_speed:
-                valid_speeds = [s for s in self.thread_speed if s is not None]
-                if valid_speeds:
-                    total_speed = sum(valid_speeds)
-                    self.overall_speed_label.configure(text=f"Speed: {total_speed:.2f} MB/s")
-
-            # Update queue display (only refreshes, no recreation unless needed)
-            if self.download_queue:
-                # Only update if there are significant changes
-                pass  # We're already doing efficient updates
-
-        except Exception as e:
-            print(f"UI update error: {e}")
-
-        # Schedule next update
-        self.after(100, self.update_thread_display)
+            # Update all thread labels based on current arrays; both arrays are
+            # sized once per download, so no per-element bounds checks are needed.
+            # Loop-invariant attributes are read once into locals.
+            last_shown = self._last_shown
+            prefixes = self._thread_prefix
+            labels = self.thread_labels
+            bars = self._BARS
+            for i, (speed, percent) in enumerate(zip(self.thread_speed, self.thread_percents)):
+                # Skip rows whose values moved less than what the label can usefully show
+                last_speed, last_percent = last_shown[i]
+                if (abs(percent - last_percent) < 0.5 and abs(speed - last_speed) < 0.05
+                        and not (percent >= 100 > last_percent)):
+                    continue
+                last_shown[i] = (speed, percent)
+
+                bar = bars[min(15, max(0, int(percent * 0.15)))]
+                status = prefixes[i] + "%5.2f MB/s (%5.1f%%) " % (speed, percent) + bar
+                labels[i].configure(text=status)
+
+            # Update overall progress and speed across all active items, touching
+            # only the widgets whose rendered text actually changed
+            if item_count:
+                overall_percent = total_percent / item_count
+                overall_text = _format_overall(round(overall_percent * 10))
+                if overall_text != self._last_overall_text:
+                    self._last_overall_text = overall_text
+                    self.overall_label.configure(text=overall_text)
+
+                fraction = overall_percent / 100
+                if abs(fraction - self._last_progress) * self._progress_width >= 1:
+                    self._last_progress = fraction
+                    self.overall_progress.set(fraction)
+
+                speed_text = _format_speed(round(total_speed * 100))
+                if speed_text != self._last_speed_text:
+                    self._last_speed_text = speed_text
+                    self.overall_speed_label.configure(text=speed_text)
+        except tk.TclError:
+            pass  # widgets already destroyed
 
     def resume_download(self):
         """Resume SELECTED paused downloads, or all paused if none selected"""
@@ -2793,7 +3453,6 @@ class DownloadManagerUI(ctk.CTk):
                             if hasattr(item.downloader, 'paused') and item.downloader.paused:
                                 item.downloader.resume()
                                 item.status = "Downloading"
-                                item.downloader.paused = False
                                 resumed_count += 1
                                 print(f"▶ Resumed: {item.filename}")
                             else:
@@ -2811,17 +3470,17 @@ class DownloadManagerUI(ctk.CTk):
                             print(f"🔄 Restarting download: {item.filename}")
                             # Change status back to Queued so it can be started again
                             item.status = "Queued"
+                            self._queued.append(item)
                             item.progress = 0
                             # Remove from active downloads if present
-                            if hasattr(self, 'active_downloads') and item in self.active_downloads:
-                                self.active_downloads.remove(item)
+                            self.active_downloads.discard(item)
                             resumed_count += 1
                         except Exception as e:
                             print(f"❌ Failed to restart: {e}")
                             failed_count += 1
 
                 if resumed_count > 0:
-                    self._update_queue_display()
+                    self._request_queue_refresh()
                     self.status_label.configure(
                         text=f"Resumed {resumed_count} selected item(s)", 
                         text_color="white"
@@ -2867,17 +3526,17 @@ class DownloadManagerUI(ctk.CTk):
                                 print(f"🔄 Restarting download: {item.filename}")
                                 # Change status back to Queued so it can be started again
                                 item.status = "Queued"
+                                self._queued.append(item)
                                 item.progress = 0
                                 # Remove from active downloads if present
-                                if hasattr(self, 'active_downloads') and item in self.active_downloads:
-                                    self.active_downloads.remove(item)
+                                self.active_downloads.discard(item)
                                 resumed_count += 1
                             except Exception as e:
                                 print(f"❌ Failed to restart: {e}")
                                 failed_count += 1
                         
                     if resumed_count > 0:
-                        self._update_queue_display()
+                        self._request_queue_refresh()
                         self.status_label.configure(
                             text=f"Resumed {resumed_count} paused item(s)", 
                             text_color="white"
@@ -2899,20 +3558,34 @@ class DownloadManagerUI(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Resume Error", f"Failed to resume download: {str(e)}")
 
+    def _prune_queued(self):
+        """Drop entries that are no longer Queued so removed items are not kept alive"""
+        self._queued = collections.deque(item for item in self._queued if item.status == "Queued")
+
+    def _free_download_slots(self):
+        """Number of items that can still start under the concurrency limit"""
+        return max(0, self.max_concurrent_downloads - len(self.active_downloads))
+
     def _check_and_start_next_download(self):
-        """Check if auto-start is enabled and start next queued download"""
+        """Fill free download slots with waiting items, then auto-start queued ones"""
         try:
-            # Check if there are any downloads running
-            if not any(item.status == "Downloading" for item in self.download_queue):
-                # Check if auto-start is enabled
-                auto_start = self._load_setting('auto_start', False)
-                if auto_start:
-                    queued_items = [item for item in self.download_queue if item.status == "Queued"]
-                    if queued_items:
-                        print(f"🔄 Auto-starting next download: {queued_items[0].filename}")
-                        self.after(1000, lambda: self._start_download_item(queued_items[0]))
-                        return True
-            return False
+            # Items the user asked to start while all slots were busy go first
+            candidates = [item for item in self.pending_downloads if item.status == "Queued"]
+            self.pending_downloads = candidates[:]
+            free = self._free_download_slots()
+
+            if self._load_setting('auto_start', False):
+                while len(candidates) < free and self._queued:
+                    item = self._queued.popleft()
+                    if item.status == "Queued" and item not in candidates:
+                        candidates.append(item)
+
+            started = False
+            for item in candidates[:free]:
+                print(f"🔄 Starting next download: {item.filename}")
+                self._start_download_item(item)
+                started = True
+            return started
         except Exception as e:
             print(f"Error in auto-start check: {e}")
             return False
@@ -2923,13 +3596,14 @@ class DownloadManagerUI(ctk.CTk):
             # Get selected items
             selected_items = [item for item in self.download_queue if item.selected]
 
-            # debug info
-            print(f"\n=== DEBUG: _update_main_button_states ===")
-            print(f"Total queue items: {len(self.download_queue)}")
-            print(f"Selected items: {len(selected_items)}")
-
-            for i,item in enumerate(self.download_queue):
-                print(f"[{i}] {item.filename[:20]}: status={item.status}, selected={item.selected}")
+            # debug info; the per-item dump only runs when debug logging is on
+            debug = _log.isEnabledFor(logging.DEBUG)
+            if debug:
+                _log.debug("_update_main_button_states: %d queue items, %d selected",
+                           len(self.download_queue), len(selected_items))
+                for i, item in enumerate(self.download_queue):
+                    _log.debug("[%d] %s: status=%s, selected=%s",
+                               i, item.filename[:20], item.status, item.selected)
             
             if selected_items:
                 # Check what actions are possible on selected items
@@ -2939,7 +3613,8 @@ class DownloadManagerUI(ctk.CTk):
                 can_cancel = any(item.status in ["Queued", "Downloading", "Paused"] 
                                for item in selected_items)
                 
-                print(f"can_start={can_start}, can_pause={can_pause}, can_resume={can_resume}, can_cancel={can_cancel}")
+                _log.debug("can_start=%s, can_pause=%s, can_resume=%s, can_cancel=%s",
+                           can_start, can_pause, can_resume, can_cancel)
 
                 # Update button states
                 self.start_btn.configure(state="normal" if can_start else "disabled")
@@ -2965,7 +3640,8 @@ class DownloadManagerUI(ctk.CTk):
                 downloading_items = [item for item in self.download_queue if item.status == "Downloading"]
                 paused_items = [item for item in self.download_queue if item.status == "Paused"]
 
-                print(f"No selection: queued={len(queued_items)}, downloading={len(downloading_items)}, paused={len(paused_items)}")
+                _log.debug("No selection: queued=%d, downloading=%d, paused=%d",
+                           len(queued_items), len(downloading_items), len(paused_items))
                 
                 # Enable buttons if there's something to do
                 self.start_btn.configure(state="normal" if queued_items else "disabled")
@@ -2973,30 +3649,27 @@ class DownloadManagerUI(ctk.CTk):
                 self.resume_btn.configure(state="normal" if paused_items else "disabled")
                 self.cancel_btn.configure(state="normal" if downloading_items or paused_items else "disabled")
 
-            # Print final button states for debugging
-            start_state = self.start_btn.cget("state")
-            pause_state = self.pause_btn.cget("state")
-            resume_state = self.resume_btn.cget("state")
-            cancel_state = self.cancel_btn.cget("state")
-                
-            print(f"Button states: Start={start_state}, Pause={pause_state}, Resume={resume_state}, Cancel={cancel_state}")
-            print("=========================================\n")
+            # Log final button states for debugging
+            if debug:
+                _log.debug("Button states: Start=%s, Pause=%s, Resume=%s, Cancel=%s",
+                           self.start_btn.cget("state"), self.pause_btn.cget("state"),
+                           self.resume_btn.cget("state"), self.cancel_btn.cget("state"))
 
-        except Exception as e:
-            print(f"Error updating button states: {e}")
+        except Exception:
+            _log.exception("Error updating button states")
 
     def _select_all_items(self):
         """Select all items in the queue"""
         for item in self.download_queue:
             item.selected = True
-        self._update_queue_display()
+        self._request_queue_refresh()
         self._update_bulk_buttons_state()
 
     def _deselect_all_items(self):
         """Deselect all items in the queue"""
         for item in self.download_queue:
             item.selected = False
-        self._update_queue_display()
+        self._request_queue_refresh()
         self._update_bulk_buttons_state()
 
     def _pause_selected(self):
@@ -3006,7 +3679,7 @@ class DownloadManagerUI(ctk.CTk):
             if item.status == "Downloading" and item.downloader:
                 item.downloader.pause()
                 item.status = "Paused"
-        self._update_queue_display()
+        self._request_queue_refresh()
         print(f"⏸ Paused {len(selected_items)} selected items")
 
     def _resume_selected(self):
@@ -3016,7 +3689,7 @@ class DownloadManagerUI(ctk.CTk):
             if item.status == "Paused" and item.downloader:
                 item.downloader.resume()
                 item.status = "Downloading"
-        self._update_queue_display()
+        self._request_queue_refresh()
         print(f"▶ Resumed {len(selected_items)} selected items")
 
     def _cancel_selected(self):
@@ -3039,39 +3712,36 @@ class DownloadManagerUI(ctk.CTk):
         indices_to_remove = []
         for i, item in enumerate(self.download_queue):
             if item.selected:
-                if item.status in ["Downloading", "Paused"] and item.downloader:
-                    # Mark as cancelled
-                    item.downloader.paused = True  # Stop downloader
+                if item.status in ["Downloading", "Paused"]:
+                    # Mark as cancelled; a worker still connecting sees the status and stops itself
                     item.status = "Cancelled"
+                    self._completed_ids.add(item.item_id)
+                    if item.downloader:
+                        item.downloader.cancel()  # Stop downloader
                     item.progress = 0
                     
                     # Record in history
-                    self.history_manager.add_record(
+                    self._queue_history_record(
                         url=item.url,
-                        filename=item.filename or os.path.basename(item.url),
+                        filename=item.filename,
                         file_size=0,
                         status="Cancelled",
                         speed=0,
                         error_msg="Cancelled by user (bulk)"
                     )
-                    
-                    # If current download was cancelled, handle it
-                    if self.current_download == item:
-                        indices_to_remove.append(i)
                         
                 elif item.status == "Queued":
+                    item.status = "Cancelled"  # tombstone for the _queued deque
                     indices_to_remove.append(i)
         
         # Remove queued items (process in reverse to maintain indices)
         for i in sorted(indices_to_remove, reverse=True):
             if i < len(self.download_queue):
                 del self.download_queue[i]
+        if indices_to_remove:
+            self._prune_queued()
         
-        # If current download was cancelled, move to next
-        if any(self.current_download == item for item in selected_items):
-            self._download_item_finished()
-        
-        self._update_queue_display()
+        self._request_queue_refresh()
         self._update_bulk_buttons_state()
         print(f"✕ Cancelled {len(selected_items)} selected items")
 
@@ -3084,7 +3754,8 @@ class DownloadManagerUI(ctk.CTk):
                 item.status = "Downloading"
             elif not item.downloader:
                 item.status = "Queued"
-        self._update_queue_display()
+                self._queued.append(item)
+        self._request_queue_refresh()
         self.status_label.configure(text=f"Resumed {len(paused)} downloads", text_color="white")
 
     def _update_bulk_buttons_state(self):
@@ -3154,9 +3825,12 @@ class DownloadManagerUI(ctk.CTk):
         print("="*60 + "\n")
 
 if __name__ == "__main__":
+    log_listener = _start_logging()
     try:
         app = DownloadManagerUI()
         app.mainloop()
-    except Exception as e:
-        print(f"Application error: {e}")
+    except Exception:
+        _log.exception("Application error")
+    finally:
+        log_listener.stop()
 
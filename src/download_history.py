@@ -1,18 +1,31 @@
 # download_history.py
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
 import csv
 
+# Faster JSON for large history files when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class DownloadHistory:
     def __init__(self, history_file="download_history.json"):
         self.history_file = history_file
         self.history = self._load_history()
+        self._stats_cache = {}  # (days, version, day) -> statistics dict, dropped on every change
+        self.version = 0  # bumped on every change so callers can cache derived views
+        self._lock = threading.Lock()  # serializes mutate+save between the writer thread and the UI
     
     def _load_history(self):
         """Load history from JSON file"""
         if os.path.exists(self.history_file):
             try:
+                if orjson is not None:
+                    with open(self.history_file, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except (json.JSONDecodeError, Exception):
@@ -20,10 +33,16 @@ class DownloadHistory:
         return []
     
     def _save_history(self):
-        """Save history to JSON file"""
+        """Save history to JSON file atomically"""
+        tmp_file = self.history_file + ".tmp"
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.history, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.history, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.history_file)
         except Exception as e:
             print(f"Error saving history: {e}")
     
@@ -40,22 +59,29 @@ class DownloadHistory:
             'duration': None  # Will be calculated when completed
         }
         
-        # Update duration for previous record if this is a completion
-        if status == "Completed" and self.history:
-            for prev_record in reversed(self.history[-5:]):  # Check last 5 records
-                if prev_record['url'] == url and prev_record.get('duration') is None:
-                    start_time = datetime.fromisoformat(prev_record['timestamp'])
-                    end_time = datetime.now()
-                    prev_record['duration'] = (end_time - start_time).total_seconds()
-                    break
-        
-        self.history.append(record)
-        
-        # Keep only last 1000 records to prevent file bloat
-        if len(self.history) > 1000:
-            self.history = self.history[-1000:]
-        
-        self._save_history()
+        with self._lock:
+            # Update duration for previous record if this is a completion
+            if status == "Completed" and self.history:
+                for prev_record in reversed(self.history[-5:]):  # Check last 5 records
+                    if prev_record['url'] == url and prev_record.get('duration') is None:
+                        start_time = datetime.fromisoformat(prev_record['timestamp'])
+                        end_time = datetime.now()
+                        prev_record['duration'] = (end_time - start_time).total_seconds()
+                        break
+            
+            self.history.append(record)
+            
+            # Keep only last 1000 records to prevent file bloat
+            if len(self.history) > 1000:
+                self.history = self.history[-1000:]
+            
+            self.invalidate()
+            self._save_history()
+    
+    def invalidate(self):
+        """Drop cached statistics after the history changes"""
+        self._stats_cache = {}
+        self.version += 1
     
     def get_recent_downloads(self, limit=50):
         """Get recent download records"""
@@ -97,26 +123,47 @@ class DownloadHistory:
             'success_rate': success_rate
         }
     
-    def export_to_csv(self, filename="download_history_export.csv"):
-        """Export history to CSV file"""
+    def get_statistics_cached(self, days=30):
+        """Get statistics for the last N days, reusing the result until the history changes"""
+        # Keying on version means a result computed across a concurrent invalidate() is never served
+        # as current, and keying on the date keeps the N-day window from going stale overnight
+        key = (days, self.version, date.today())
+        cache = self._stats_cache
+        stats = cache.get(key)
+        if stats is None:
+            stats = self.get_statistics(days)
+            cache[key] = stats
+        return stats
+    
+    def _csv_rows(self, records):
+        """Yield one clean CSV row per history record"""
+        for record in records:
+            yield {
+                'timestamp': record['timestamp'],
+                'filename': record['filename'],
+                'url': record['url'][:100],  # Truncate long URLs
+                'file_size': record.get('file_size', 0),
+                'status': record['status'],
+                'download_speed': f"{record.get('download_speed', 0):.2f}",
+                'error_message': record.get('error_message', '')[:50]  # Truncate long errors
+            }
+    
+    def export_to_csv(self, filename="download_history_export.csv", progress_callback=None):
+        """Export history to CSV file, streaming rows through a buffered writer"""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            records = self.history
+            total = len(records)
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 fieldnames = ['timestamp', 'filename', 'url', 'file_size', 'status', 'download_speed', 'error_message']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 
                 writer.writeheader()
-                for record in self.history:
-                    # Create a clean record for CSV
-                    clean_record = {
-                        'timestamp': record['timestamp'],
-                        'filename': record['filename'],
-                        'url': record['url'][:100],  # Truncate long URLs
-                        'file_size': record.get('file_size', 0),
-                        'status': record['status'],
-                        'download_speed': f"{record.get('download_speed', 0):.2f}",
-                        'error_message': record.get('error_message', '')[:50]  # Truncate long errors
-                    }
-                    writer.writerow(clean_record)
+                for written, row in enumerate(self._csv_rows(records), 1):
+                    writer.writerow(row)
+                    if progress_callback and written % 500 == 0:
+                        progress_callback(written, total)
+            if progress_callback:
+                progress_callback(total, total)
             return True
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
@@ -124,5 +171,7 @@ class DownloadHistory:
     
     def clear_history(self):
         """Clear all download history"""
-        self.history = []
-        self._save_history()
\ No newline at end of file
+        with self._lock:
+            self.history = []
+            self.invalidate()
+            self._save_history()
\ No newline at end of file
@@ -7,6 +7,11 @@ import psutil
 
 MAX_RETRIES = 10
 RETRY_DELAY = 2  # seconds
+BYTES_TO_MB = 1.0 / (1024 * 1024)
+READ_CHUNK_SIZE = 1024 * 64  # network read size; small enough to keep pause/cancel responsive
+
+class DownloadCancelled(Exception):
+    """Raised by FastDownloader.start() when the download was cancelled"""
 
 def sanitize_filename(url):
         filename = url.split("/")[-1]
@@ -21,6 +26,7 @@ class FastDownloader:
         self.download_path = download_path or os.getcwd()
         self.exceptions = [] # To track exceptions from thread
         self.messages = []
+        self.cancelled = False
 
         # Convert to absolute path for consistency
         if self.download_path:
@@ -195,7 +201,7 @@ class FastDownloader:
                     self.callback(part_index, 0, 100)
                 return
 
-        while downloaded < (end - start + 1) and retries < MAX_RETRIES:
+        while downloaded < (end - start + 1) and retries < MAX_RETRIES and not self.cancelled:
             try:
                 range_start = start + downloaded
                 headers = {"Range": f"bytes={range_start}-{end}"}
@@ -206,7 +212,7 @@ class FastDownloader:
 
                     r.raise_for_status()
 
-                    # Determine chunk size based on remaining part size
+                    # Determine write buffer size based on remaining part size
                     part_size = end - start + 1
                     if part_size > 1024 * 1024 * 1024:  # >1GB
                         chunk_size = 1024 * 1024 * 4 # 4MB chunks for large files
@@ -221,15 +227,19 @@ class FastDownloader:
                     else:
                         chunk_size = 1024 * 64 # 64KB chunks for tiny files
                     
-                    with open(part_file, "ab") as f:
+                    # Reads are coalesced in the file buffer so each write() syscall moves a whole chunk
+                    with open(part_file, "ab", buffering=chunk_size) as f:
                         last_time = time.time()
                         last_downloaded = downloaded
                         bytes_since_flush = 0 # Track bytes since last flush
                         
-                        for chunk in r.iter_content(chunk_size=1024 * 16):
+                        for chunk in r.iter_content(chunk_size=READ_CHUNK_SIZE):
                             # Handle pause
-                            while self.paused:
+                            while self.paused and not self.cancelled:
                                 time.sleep(0.1)
+
+                            if self.cancelled:
+                                return
                                 
                             if not chunk:
                                 continue
@@ -253,7 +263,7 @@ class FastDownloader:
                             delta_time = now - last_time
                             
                             if delta_time > 0.5:  # Update speed every 0.5s
-                                speed_in_MB = (delta_bytes / delta_time) / (1024 * 1024)
+                                speed_in_MB = (delta_bytes / delta_time) * BYTES_TO_MB
                                 self.thread_speed[part_index] = speed_in_MB
                                 last_time = now
                                 last_downloaded = downloaded
@@ -268,6 +278,8 @@ class FastDownloader:
                 break  # Successfully completed
                 
             except Exception as e:
+                if self.cancelled:
+                    return
                 retries += 1
                 if retries >= MAX_RETRIES:
                     error_type = type(e).__name__
@@ -290,6 +302,12 @@ class FastDownloader:
         self.paused = False
         print(f"▶ Download Resumed: {self.filename}")
 
+    def cancel(self):
+        """Stop all download threads; start() raises DownloadCancelled once they exit"""
+        self.cancelled = True
+        self.paused = False
+        print(f"✕ Download Cancelled: {self.filename}")
+
     def merge_parts(self):
         print("\n🔗 Merging downloaded parts...")
 
@@ -389,10 +407,13 @@ class FastDownloader:
                 
 
                 output_file = os.path.join(self.download_path,self.filename) if self.download_path else self.filename
-                with open(output_file, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=1024 * 64):
-                        while self.paused:
+                with open(output_file, "wb", buffering=1024 * 1024) as f:
+                    for chunk in r.iter_content(chunk_size=READ_CHUNK_SIZE):
+                        while self.paused and not self.cancelled:
                             time.sleep(0.1)
+
+                        if self.cancelled:
+                            raise DownloadCancelled(f"Download cancelled: {self.filename}")
                             
                         if not chunk:
                             continue
@@ -404,7 +425,7 @@ class FastDownloader:
                         now = time.time()
                         if now - last_update > 0.1:  # Update every 100ms
                             elapsed = now - start_time
-                            speed_in_MB = (downloaded / elapsed) / (1024 * 1024) if elapsed > 0 else 0
+                            speed_in_MB = (downloaded / elapsed) * BYTES_TO_MB if elapsed > 0 else 0
                             percent = (downloaded / total_size * 100) if total_size > 0 else 0
                             
                             if self.callback:
@@ -420,6 +441,8 @@ class FastDownloader:
             raise
 
     def start(self):
+        if self.cancelled:
+            raise DownloadCancelled(f"Download cancelled: {self.filename}")
         print(f"🚀 Starting download: {self.filename}")
         print(f"📁 File size: {self.file_size} bytes")
         print(f"📁 Download path: {self.download_path}")
@@ -446,6 +469,9 @@ class FastDownloader:
                 for t in threads:
                     t.join()
 
+                if self.cancelled:
+                    raise DownloadCancelled(f"Download cancelled: {self.filename}")
+
                 if hasattr(self, 'exceptions') and self.exceptions:
                     print(f"❌ Download failed with {len(self.exceptions)} error(s)")
                     raise self.exceptions[0] # Raise the first exception
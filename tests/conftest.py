@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules live in src/ and are imported by their bare names, as the app does
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,97 @@
+from download_history import DownloadHistory
+
+
+def make_history(tmp_path):
+    return DownloadHistory(history_file=str(tmp_path / "history.json"))
+
+
+def test_add_record_bumps_version(tmp_path):
+    history = make_history(tmp_path)
+    version = history.version
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed", speed=1.5)
+    assert history.version == version + 1
+
+
+def test_clear_history_bumps_version(tmp_path):
+    history = make_history(tmp_path)
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed")
+    version = history.version
+    history.clear_history()
+    assert history.version == version + 1
+
+
+def test_statistics_cached_until_add_record(tmp_path):
+    history = make_history(tmp_path)
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed")
+    first = history.get_statistics_cached(30)
+    assert history.get_statistics_cached(30) is first
+    assert first['total_downloads'] == 1
+
+    history.add_record("http://example.com/b.zip", "b.zip", 0, "Error", error_msg="boom")
+    second = history.get_statistics_cached(30)
+    assert second is not first
+    assert second['total_downloads'] == 2
+    assert second['failed_downloads'] == 1
+
+
+def test_statistics_cache_dropped_by_clear_history(tmp_path):
+    history = make_history(tmp_path)
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed")
+    assert history.get_statistics_cached(30)['total_downloads'] == 1
+
+    history.clear_history()
+    assert history.get_statistics_cached(30)['total_downloads'] == 0
+
+
+def test_statistics_computed_across_invalidate_not_served(tmp_path, monkeypatch):
+    history = make_history(tmp_path)
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed")
+    compute = history.get_statistics
+
+    def racing_compute(days):
+        stats = compute(days)
+        # The writer thread adds a record while the UI is still computing
+        history.add_record("http://example.com/b.zip", "b.zip", 100, "Completed")
+        return stats
+
+    monkeypatch.setattr(history, "get_statistics", racing_compute)
+    assert history.get_statistics_cached(30)['total_downloads'] == 1
+    monkeypatch.setattr(history, "get_statistics", compute)
+    assert history.get_statistics_cached(30)['total_downloads'] == 2
+
+
+def test_history_persists_across_instances(tmp_path):
+    history = make_history(tmp_path)
+    history.add_record("http://example.com/a.zip", "a.zip", 100, "Completed")
+    assert make_history(tmp_path).history[0]['filename'] == "a.zip"
+    assert not (tmp_path / "history.json.tmp").exists()
+
+
+def test_export_to_csv_reports_monotonic_progress(tmp_path):
+    history = make_history(tmp_path)
+    history.history = [
+        {
+            'timestamp': "2024-01-01T00:00:00",
+            'url': f"http://example.com/{i}.zip",
+            'filename': f"{i}.zip",
+            'file_size': i,
+            'status': "Completed",
+            'download_speed': 1.0,
+            'error_message': "",
+        }
+        for i in range(1234)
+    ]
+    calls = []
+
+    def progress(done, total):
+        calls.append((done, total))
+
+    assert history.export_to_csv(str(tmp_path / "export.csv"), progress_callback=progress)
+
+    assert len(calls) > 1
+    done = [d for d, _ in calls]
+    assert done == sorted(done)
+    assert all(total == 1234 for _, total in calls)
+    assert calls[-1] == (1234, 1234)
+    with open(tmp_path / "export.csv", encoding='utf-8') as f:
+        assert sum(1 for _ in f) == 1235  # header + one line per record
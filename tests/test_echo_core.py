@@ -0,0 +1,54 @@
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("psutil")
+
+import echo_core
+from echo_core import FastDownloader, DownloadCancelled
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Make every HTTP call fail so FastDownloader falls back to its defaults"""
+    def refuse(*args, **kwargs):
+        raise requests.ConnectionError("offline")
+    monkeypatch.setattr(echo_core.requests, "head", refuse)
+    monkeypatch.setattr(requests.Session, "get", refuse)
+
+
+def test_start_after_cancel_raises_cancelled(offline, tmp_path):
+    downloader = FastDownloader("http://example.com/file.bin", download_path=str(tmp_path))
+    downloader.cancel()
+    with pytest.raises(DownloadCancelled):
+        downloader.start()
+
+
+def test_download_part_stops_retrying_once_cancelled(offline, monkeypatch, tmp_path):
+    downloader = FastDownloader("http://example.com/file.bin", download_path=str(tmp_path))
+    calls = []
+    sleeps = []
+
+    def fail_and_cancel(*args, **kwargs):
+        calls.append(kwargs.get("headers"))
+        downloader.cancel()
+        raise requests.ConnectionError("reset")
+
+    monkeypatch.setattr(downloader.session, "get", fail_and_cancel)
+    monkeypatch.setattr(echo_core.time, "sleep", sleeps.append)
+
+    downloader.download_part(0, 1023, 0)
+
+    assert len(calls) == 1
+    assert sleeps == []
+    assert downloader.exceptions == []
+
+
+def test_download_part_skips_work_when_already_cancelled(offline, monkeypatch, tmp_path):
+    downloader = FastDownloader("http://example.com/file.bin", download_path=str(tmp_path))
+    downloader.cancel()
+    calls = []
+    monkeypatch.setattr(downloader.session, "get", lambda *a, **k: calls.append(a))
+
+    downloader.download_part(0, 1023, 0)
+
+    assert calls == []